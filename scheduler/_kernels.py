@@ -0,0 +1,170 @@
+"""
+Numeric kernels for the scheduling hot paths.
+
+Kernels are JIT-compiled with numba when it is installed; otherwise an
+equivalent numpy implementation is used.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
+
+# Sentinel day ordinal for a team that has not played yet
+NEVER_PLAYED = -1
+
+# Idle days reported for a team that has not played yet
+NEVER_PLAYED_IDLE = 999
+
+
+def _score_slots_loop(slot_day, slot_week, home_last_day, away_last_day,
+                      rest_min, max_gap, w_idle, w_wk, eml_const, ha_const,
+                      week_target, noise):
+    """Score each slot for a matchup (lower is better), one slot at a time."""
+    n = slot_day.shape[0]
+    scores = np.empty(n, dtype=np.float64)
+    span = max_gap - rest_min
+    
+    for i in range(n):
+        idle_penalty = 0.0
+        for last_day in (home_last_day, away_last_day):
+            if last_day == NEVER_PLAYED:
+                idle = NEVER_PLAYED_IDLE
+            else:
+                idle = slot_day[i] - last_day
+            
+            if idle <= rest_min:
+                pass
+            elif idle >= max_gap:
+                idle_penalty += 1000.0
+            else:
+                normalized = (idle - rest_min) / span
+                idle_penalty += normalized ** 2
+        
+        score = w_idle * idle_penalty
+        score += eml_const
+        score += ha_const
+        score += w_wk * abs(week_target - slot_week[i])
+        score += noise[i]
+        scores[i] = score
+    
+    return scores
+
+
+def _idle_penalty_numpy(slot_day, last_day, rest_min, max_gap):
+    """Vectorized idle penalty for one team across slot days."""
+    if last_day == NEVER_PLAYED:
+        idle = np.full(slot_day.shape[0], NEVER_PLAYED_IDLE)
+    else:
+        idle = slot_day - last_day
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        normalized = (idle - rest_min) / (max_gap - rest_min)
+    return np.select(
+        [idle <= rest_min, idle >= max_gap],
+        [0.0, 1000.0],
+        default=normalized ** 2
+    )
+
+
+def _score_slots_numpy(slot_day, slot_week, home_last_day, away_last_day,
+                       rest_min, max_gap, w_idle, w_wk, eml_const, ha_const,
+                       week_target, noise):
+    """Score each slot for a matchup (lower is better) with array ops."""
+    scores = w_idle * (_idle_penalty_numpy(slot_day, home_last_day, rest_min, max_gap) +
+                       _idle_penalty_numpy(slot_day, away_last_day, rest_min, max_gap))
+    scores += eml_const
+    scores += ha_const
+    scores += w_wk * np.abs(week_target - slot_week)
+    scores += noise
+    return scores
+
+
+if HAS_NUMBA:
+    score_slots = njit(cache=True)(_score_slots_loop)
+else:
+    score_slots = _score_slots_numpy
+
+
+@njit(cache=True)
+def round_robin_indices(n_teams):
+    """
+    Circle-method round robin for an even number of teams.
+    
+    Returns:
+        (n_rounds * n_teams / 2, 4) int array of (home_idx, away_idx,
+        week, order_in_week) rows, weeks and orders counted from 1
+    """
+    n_rounds = n_teams - 1
+    half = n_teams // 2
+    positions = np.arange(n_teams)
+    out = np.empty((n_rounds * half, 4), dtype=np.int64)
+    
+    row = 0
+    for round_num in range(n_rounds):
+        for i in range(half):
+            out[row, 0] = positions[i]
+            out[row, 1] = positions[n_teams - 1 - i]
+            out[row, 2] = round_num + 1
+            out[row, 3] = i + 1
+            row += 1
+        
+        # Rotate every position but the first one step to the right
+        last = positions[n_teams - 1]
+        for k in range(n_teams - 1, 1, -1):
+            positions[k] = positions[k - 1]
+        positions[1] = last
+    
+    return out
+
+
+@njit(parallel=True, cache=True)
+def team_gap_stats(ordinals, offsets):
+    """
+    Mean, min and max gap in days for each team, in parallel over teams.
+    
+    Args:
+        ordinals: Game day ordinals of all teams, each team's run sorted
+        offsets: CSR offsets; team t owns ordinals[offsets[t]:offsets[t + 1]]
+    
+    Returns:
+        (mean, min, max) arrays, zero for teams with fewer than two games
+    """
+    n_teams = offsets.shape[0] - 1
+    mean_gap = np.zeros(n_teams, dtype=np.float64)
+    min_gap = np.zeros(n_teams, dtype=np.int64)
+    max_gap = np.zeros(n_teams, dtype=np.int64)
+    
+    for t in prange(n_teams):
+        start = offsets[t]
+        end = offsets[t + 1]
+        if end - start < 2:
+            continue
+        
+        total = 0
+        lo = ordinals[start + 1] - ordinals[start]
+        hi = lo
+        for i in range(start + 1, end):
+            gap = ordinals[i] - ordinals[i - 1]
+            total += gap
+            if gap < lo:
+                lo = gap
+            if gap > hi:
+                hi = gap
+        
+        mean_gap[t] = total / (end - start - 1)
+        min_gap[t] = lo
+        max_gap[t] = hi
+    
+    return mean_gap, min_gap, max_gap
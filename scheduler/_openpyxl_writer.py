@@ -0,0 +1,159 @@
+"""
+openpyxl write-only backend for the Excel exporter.
+
+Implements the small part of the xlsxwriter Workbook/Worksheet API that
+export.py uses, on top of an openpyxl write-only workbook. Rows are
+streamed to the sheet in order, and every cell style is built once per
+format rather than per cell.
+"""
+
+from typing import Any, Dict, List, Optional
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.formatting.rule import CellIsRule
+from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+from openpyxl.utils import get_column_letter
+
+# xlsxwriter conditional-format criteria -> openpyxl CellIsRule operators
+_CRITERIA = {
+    '>': 'greaterThan',
+    '>=': 'greaterThanOrEqual',
+    '<': 'lessThan',
+    '<=': 'lessThanOrEqual',
+    '==': 'equal',
+    '!=': 'notEqual',
+}
+
+
+def _color(value: str) -> str:
+    """Convert an xlsxwriter '#RRGGBB' color to openpyxl's 'RRGGBB'."""
+    return value.lstrip('#').upper()
+
+
+class CellStyle:
+    """openpyxl style objects built once from an xlsxwriter format dict."""
+    
+    def __init__(self, properties: Dict[str, Any]):
+        self.font = Font(bold=True) if properties.get('bold') else None
+        self.number_format = properties.get('num_format')
+        
+        self.alignment = None
+        if properties.get('text_wrap') or properties.get('valign'):
+            self.alignment = Alignment(wrap_text=properties.get('text_wrap', False),
+                                       vertical=properties.get('valign'))
+        
+        self.border = None
+        if properties.get('border'):
+            side = Side(style='thin')
+            self.border = Border(left=side, right=side, top=side, bottom=side)
+        
+        # Cells are filled with fg_color; conditional formats use bg_color
+        self.fill = None
+        if properties.get('fg_color'):
+            self.fill = PatternFill(fill_type='solid', start_color=_color(properties['fg_color']))
+        self.highlight = None
+        if properties.get('bg_color'):
+            self.highlight = PatternFill(bgColor=_color(properties['bg_color']))
+    
+    def apply(self, cell: WriteOnlyCell) -> WriteOnlyCell:
+        """Set this style's attributes on a write-only cell."""
+        if self.font is not None:
+            cell.font = self.font
+        if self.number_format is not None:
+            cell.number_format = self.number_format
+        if self.alignment is not None:
+            cell.alignment = self.alignment
+        if self.border is not None:
+            cell.border = self.border
+        if self.fill is not None:
+            cell.fill = self.fill
+        return cell
+
+
+class WriteOnlySheet:
+    """Worksheet wrapper that buffers one row at a time and appends in order."""
+    
+    def __init__(self, worksheet):
+        self._ws = worksheet
+        self._next_row = 0
+        self._current_row: Optional[int] = None
+        self._pending: Dict[int, Any] = {}
+    
+    def write(self, row: int, col: int, value: Any, cell_format: Optional[CellStyle] = None) -> None:
+        """Write one cell; rows must be written in ascending order."""
+        if row != self._current_row:
+            if self._current_row is not None and row < self._current_row:
+                raise ValueError(f"Row {row} written after row {self._current_row}")
+            self._flush()
+            self._current_row = row
+        
+        if cell_format is not None:
+            value = cell_format.apply(WriteOnlyCell(self._ws, value=value))
+        self._pending[col] = value
+    
+    def write_row(self, row: int, col: int, values, cell_format: Optional[CellStyle] = None) -> None:
+        """Write consecutive cells of one row starting at col."""
+        for offset, value in enumerate(values):
+            self.write(row, col + offset, value, cell_format)
+    
+    def set_column(self, first_col: int, last_col: int, width: float) -> None:
+        """Set the width of a range of columns."""
+        for col in range(first_col, last_col + 1):
+            self._ws.column_dimensions[get_column_letter(col + 1)].width = width
+    
+    def conditional_format(self, first_row: int, first_col: int, last_row: int, last_col: int,
+                           options: Dict[str, Any]) -> None:
+        """Add a 'cell' type conditional format over a cell range."""
+        cell_range = (f"{get_column_letter(first_col + 1)}{first_row + 1}:"
+                      f"{get_column_letter(last_col + 1)}{last_row + 1}")
+        rule = CellIsRule(
+            operator=_CRITERIA[options['criteria']],
+            formula=[str(options['value'])],
+            fill=options['format'].highlight
+        )
+        self._ws.conditional_formatting.add(cell_range, rule)
+    
+    def _flush(self) -> None:
+        """Append the buffered row, padding skipped rows with blanks."""
+        if self._current_row is None:
+            return
+        
+        while self._next_row < self._current_row:
+            self._ws.append([])
+            self._next_row += 1
+        
+        cells: List[Any] = [None] * (max(self._pending, default=-1) + 1)
+        for col, value in self._pending.items():
+            cells[col] = value
+        self._ws.append(cells)
+        
+        self._next_row = self._current_row + 1
+        self._current_row = None
+        self._pending = {}
+
+
+class WriteOnlyWorkbook:
+    """openpyxl write-only workbook exposing the xlsxwriter calls export.py uses."""
+    
+    def __init__(self, output_path: str):
+        self._output_path = output_path
+        self._workbook = Workbook(write_only=True)
+        self._sheets: List[WriteOnlySheet] = []
+    
+    def add_format(self, properties: Dict[str, Any]) -> CellStyle:
+        """Build a reusable cell style."""
+        return CellStyle(properties)
+    
+    def add_worksheet(self, name: str) -> WriteOnlySheet:
+        """Add a sheet at the end of the workbook."""
+        sheet = WriteOnlySheet(self._workbook.create_sheet(name))
+        self._sheets.append(sheet)
+        return sheet
+    
+    def close(self) -> None:
+        """Flush every sheet and save the workbook."""
+        for sheet in self._sheets:
+            sheet._flush()
+        if not self._sheets:
+            self._workbook.create_sheet("Sheet1")
+        self._workbook.save(self._output_path)
@@ -2,6 +2,8 @@
 Command-line interface for the league scheduler.
 """
 
+import logging
+import logging.handlers
 import argparse
 import sys
 import yaml
@@ -10,9 +12,38 @@ from .config import SchedulerConfig, load_config
 from .ingest import load_slots, create_teams_from_config
 from .matchups import build_matchups
 from .engine import schedule, validate_schedule
-from .passes import cap_fix, smooth_gaps, balance_weekdays, balance_home_away
+from .passes import run_passes
 from .export import write_excel
 
+# Named explicitly: __name__ is "__main__" under `python -m scheduler.cli`
+logger = logging.getLogger("scheduler.cli")
+
+# Buffered log records; flushed when full or on a warning
+LOG_BUFFER_CAPACITY = 1024
+
+
+def _configure_logging() -> logging.Handler:
+    """
+    Route scheduler log messages to stdout through a memory buffer.
+    
+    Returns:
+        logging.Handler: Buffering handler, to be closed when the run ends
+    """
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(message)s"))
+    
+    handler = logging.handlers.MemoryHandler(
+        capacity=LOG_BUFFER_CAPACITY,
+        flushLevel=logging.WARNING,
+        target=console
+    )
+    
+    package_logger = logging.getLogger("scheduler")
+    package_logger.addHandler(handler)
+    package_logger.setLevel(logging.INFO)
+    package_logger.propagate = False
+    return handler
+
 
 def main():
     """Main CLI entry point."""
@@ -43,6 +74,12 @@ def main():
         help="Path to Excel file with pre-defined matchups (optional)"
     )
     
+    parser.add_argument(
+        "--solver",
+        choices=["greedy", "backtrack", "cpsat"],
+        help="Scheduling algorithm (overrides the configuration file)"
+    )
+    
     parser.add_argument(
         "--no-passes",
         action="store_true",
@@ -62,127 +99,122 @@ def main():
     )
     
     args = parser.parse_args()
+    log_handler = _configure_logging()
     
     try:
         # Load configuration
-        print("Loading configuration...")
+        logger.info("Loading configuration...")
         config = load_config(args.config)
+        if args.solver:
+            config.solver = args.solver
         
         # Load slots
-        print("Loading available time slots...")
+        logger.info("Loading available time slots...")
         slots = load_slots(args.slots, config)
-        print(f"Loaded {len(slots)} time slots")
+        logger.info("Loaded %s time slots", len(slots))
         
         # Create teams
-        print("Creating teams...")
+        logger.info("Creating teams...")
         teams = create_teams_from_config(config)
-        print(f"Created {len(teams)} teams")
+        logger.info("Created %s teams", len(teams))
         
         # Build matchups
-        print("Building matchups...")
+        logger.info("Building matchups...")
         matchups = build_matchups(
             config=config,
             matchup_file=args.matchups,
             double_round=True,
             include_cross_division=False
         )
-        print(f"Built {len(matchups)} matchups")
+        logger.info("Built %s matchups", len(matchups))
         
         # Run initial scheduling
-        print("Running initial scheduling...")
+        logger.info("Running initial scheduling...")
         initial_schedule = schedule(slots, matchups, config, teams)
-        print(f"Scheduled {len(initial_schedule.games)} games")
+        logger.info("Scheduled %s games", len(initial_schedule.games))
         
         # Validate initial schedule
-        print("Validating initial schedule...")
+        logger.info("Validating initial schedule...")
         violations = validate_schedule(initial_schedule, config)
         
         if violations['errors']:
-            print("ERRORS found in initial schedule:")
+            logger.warning("ERRORS found in initial schedule:")
             for error in violations['errors']:
-                print(f"  - {error}")
+                logger.warning("  - %s", error)
         
         if violations['warnings']:
-            print("WARNINGS found in initial schedule:")
+            logger.info("WARNINGS found in initial schedule:")
             for warning in violations['warnings']:
-                print(f"  - {warning}")
+                logger.info("  - %s", warning)
         
         if args.validate_only:
-            print("Validation complete. Exiting.")
+            logger.info("Validation complete. Exiting.")
             return
         
         # Run optimization passes
         if not args.no_passes:
-            print("Running optimization passes...")
-            
-            # Cap fix pass
-            print("\n1. Running cap fix pass...")
-            schedule_after_cap = cap_fix(initial_schedule, config)
+            logger.info("Running optimization passes...")
             
-            # Gap smoothing pass
-            print("\n2. Running gap smoothing pass...")
-            schedule_after_smooth = smooth_gaps(schedule_after_cap, config)
-            
-            # Weekday balance pass
-            print("\n3. Running weekday balance pass...")
-            schedule_after_weekday = balance_weekdays(schedule_after_smooth, config)
-            
-            # Home/away balance pass
-            print("\n4. Running home/away balance pass...")
-            final_schedule = balance_home_away(schedule_after_weekday, config)
+            # Cap fix, gap smoothing, weekday and home/away balance passes,
+            # parallelized across independent divisions
+            final_schedule = run_passes(initial_schedule, config)
         else:
             final_schedule = initial_schedule
         
         # Validate final schedule
-        print("\nValidating final schedule...")
+        logger.info("Validating final schedule...")
         final_violations = validate_schedule(final_schedule, config)
         
         if final_violations['errors']:
-            print("ERRORS found in final schedule:")
+            logger.warning("ERRORS found in final schedule:")
             for error in final_violations['errors']:
-                print(f"  - {error}")
+                logger.warning("  - %s", error)
         else:
-            print("No errors found in final schedule!")
+            logger.info("No errors found in final schedule!")
         
         if final_violations['warnings']:
-            print("WARNINGS found in final schedule:")
+            logger.info("WARNINGS found in final schedule:")
             for warning in final_violations['warnings']:
-                print(f"  - {warning}")
+                logger.info("  - %s", warning)
         
         # Export to Excel
-        print(f"\nExporting schedule to {args.out}...")
+        logger.info("Exporting schedule to %s...", args.out)
         write_excel(final_schedule, config, args.out)
         
         # Print summary
-        print("\n" + "="*50)
-        print("SCHEDULING COMPLETE")
-        print("="*50)
+        logger.info("=" * 50)
+        logger.info("SCHEDULING COMPLETE")
+        logger.info("=" * 50)
         
         stats = final_schedule.get_summary_stats()
-        print(f"Total games scheduled: {stats.get('total_games', 0)}")
-        print(f"Total teams: {stats.get('total_teams', 0)}")
-        print(f"Date range: {stats.get('date_range', {}).get('start', 'N/A')} to {stats.get('date_range', {}).get('end', 'N/A')}")
+        logger.info("Total games scheduled: %s", stats.get('total_games', 0))
+        logger.info("Total teams: %s", stats.get('total_teams', 0))
+        logger.info("Date range: %s to %s", stats.get('date_range', {}).get('start', 'N/A'), stats.get('date_range', {}).get('end', 'N/A'))
         
         if 'eml_distribution' in stats:
-            print(f"E/M/L distribution: {stats['eml_distribution']}")
+            logger.info("E/M/L distribution: %s", stats['eml_distribution'])
         
         if 'weekday_distribution' in stats:
-            print(f"Weekday distribution: {stats['weekday_distribution']}")
-        
-        print(f"\nSchedule exported to: {args.out}")
+            logger.info("Weekday distribution: %s", stats['weekday_distribution'])
         
+        logger.info("Schedule exported to: %s", args.out)
+    
     except FileNotFoundError as e:
-        print(f"ERROR: File not found: {e}")
+        logger.error("ERROR: File not found: %s", e)
         sys.exit(1)
     except yaml.YAMLError as e:
-        print(f"ERROR: Invalid YAML configuration: {e}")
+        logger.error("ERROR: Invalid YAML configuration: %s", e)
         sys.exit(1)
     except Exception as e:
-        print(f"ERROR: {e}")
+        logger.error("ERROR: %s", e)
         if args.verbose:
             import traceback
+            log_handler.flush()
             traceback.print_exc()
         sys.exit(1)
+    finally:
+        logging.getLogger("scheduler").removeHandler(log_handler)
+        log_handler.close()
 
 
 if __name__ == "__main__":
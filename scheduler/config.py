@@ -2,6 +2,7 @@
 Configuration management for the league scheduler.
 """
 
+from functools import cached_property
 from pydantic import BaseModel, Field, field_validator
 from typing import List, Dict, Optional, Union
 from datetime import time
@@ -43,6 +44,18 @@ class ExcelOut(BaseModel):
         },
         description="Sheet names and options"
     )
+    engine: str = Field(
+        default="xlsxwriter",
+        description="Excel writer: xlsxwriter, or openpyxl_writeonly for very large schedules"
+    )
+    
+    @field_validator('engine')
+    @classmethod
+    def validate_engine(cls, v):
+        valid_engines = ["xlsxwriter", "openpyxl_writeonly"]
+        if v not in valid_engines:
+            raise ValueError(f"Invalid Excel engine: {v}. Must be one of {valid_engines}")
+        return v
 
 
 class SubDivision(BaseModel):
@@ -90,6 +103,9 @@ class SchedulerConfig(BaseModel):
     # Random seed for reproducibility
     seed: int = Field(default=42, description="Random seed for tie-breaking")
     
+    # Scheduling algorithm
+    solver: str = Field(default="greedy", description="Scheduling algorithm: greedy, backtrack or cpsat")
+    
     # Output configuration
     excel: ExcelOut = Field(default_factory=ExcelOut)
     
@@ -111,6 +127,14 @@ class SchedulerConfig(BaseModel):
                 raise ValueError(f"Invalid weekday: {day}. Must be one of {valid_days}")
         return v
     
+    @field_validator('solver')
+    @classmethod
+    def validate_solver(cls, v):
+        valid_solvers = ["greedy", "backtrack", "cpsat"]
+        if v not in valid_solvers:
+            raise ValueError(f"Invalid solver: {v}. Must be one of {valid_solvers}")
+        return v
+    
     def get_all_teams(self) -> List[str]:
         """Get all teams from all divisions."""
         teams = []
@@ -119,13 +143,19 @@ class SchedulerConfig(BaseModel):
                 teams.extend(sub_div.teams)
         return teams
     
-    def get_team_division(self, team: str) -> Optional[str]:
-        """Get the division name for a given team."""
+    @cached_property
+    def team_division_map(self) -> Dict[str, str]:
+        """Map each team name to its division name (computed once per config)."""
+        team_divisions = {}
         for division in self.divisions:
             for sub_div in division.sub_divisions:
-                if team in sub_div.teams:
-                    return division.name
-        return None
+                for team in sub_div.teams:
+                    team_divisions[team] = division.name
+        return team_divisions
+    
+    def get_team_division(self, team: str) -> Optional[str]:
+        """Get the division name for a given team."""
+        return self.team_division_map.get(team)
 
 
 def load_config(config_path: str) -> SchedulerConfig:
@@ -0,0 +1,127 @@
+"""
+OR-Tools CP-SAT solver for the league scheduler.
+
+The model has one boolean per (matchup, eligible slot) pair. Each matchup
+uses at most one slot, each slot hosts at most one game, and every team
+plays at most once in any window of rest_min_days consecutive days. The
+objective schedules as many matchups as possible, then minimizes the
+week-rotation cost used by the greedy scorer.
+"""
+
+from bisect import bisect_left
+from collections import defaultdict
+from typing import List, Dict, Optional
+import numpy as np
+from .models import Slot, Team, Matchup, Schedule
+from .config import SchedulerConfig
+
+try:
+    from ortools.sat.python import cp_model
+    HAS_ORTOOLS = True
+except ImportError:
+    HAS_ORTOOLS = False
+
+
+# Solver wall-clock limit in seconds
+CPSAT_TIME_LIMIT_SECONDS = 60.0
+
+# Integer scale applied to float weights in the objective
+COST_SCALE = 100
+
+# Objective reward for each scheduled matchup; dominates any slot cost
+SCHEDULED_REWARD = 10 ** 6
+
+
+def solve_cpsat(slots: List[Slot], matchups: List[Matchup], teams: Dict[str, Team],
+                config: SchedulerConfig) -> Schedule:
+    """
+    Schedule matchups with the CP-SAT solver.
+    
+    Args:
+        slots: Available time slots
+        matchups: Matchups to schedule
+        teams: Team objects with state
+        config: Scheduler configuration
+    
+    Returns:
+        Schedule: Complete schedule (greedy result if OR-Tools is missing)
+    """
+    from .engine import SchedulingEngine
+    
+    engine = SchedulingEngine(config.model_copy(update={'solver': 'cpsat'}))
+    return engine.schedule(slots, matchups, teams)
+
+
+def solve_assignment(slot_day: np.ndarray, slot_week: np.ndarray,
+                     domains: List[np.ndarray], matchups: List[Matchup],
+                     config: SchedulerConfig) -> Optional[Dict[int, Matchup]]:
+    """
+    Solve the matchup -> slot assignment problem.
+    
+    Args:
+        slot_day: Day ordinal of each slot
+        slot_week: Week number of each slot
+        domains: Eligible slot indices for each matchup
+        matchups: Matchups to schedule, aligned with domains
+        config: Scheduler configuration
+    
+    Returns:
+        Dict mapping slot index to matchup, or None if no solution was found
+    """
+    model = cp_model.CpModel()
+    
+    placement = {}
+    slot_users = defaultdict(list)
+    team_plays = defaultdict(list)
+    objective_vars = []
+    objective_coeffs = []
+    
+    for m_idx, (matchup, eligible) in enumerate(zip(matchups, domains)):
+        week_cost = np.abs(matchup.week_target - slot_week[eligible]) * config.weights.week_rotation
+        costs = np.rint(week_cost * COST_SCALE).astype(np.int64)
+        
+        choices = []
+        for slot_idx, cost in zip(eligible.tolist(), costs.tolist()):
+            var = model.NewBoolVar(f"{matchup.matchup_id}@{slot_idx}")
+            placement[m_idx, slot_idx] = var
+            choices.append(var)
+            slot_users[slot_idx].append(var)
+            day = int(slot_day[slot_idx])
+            team_plays[matchup.home_team].append((day, var))
+            team_plays[matchup.away_team].append((day, var))
+            objective_vars.append(var)
+            objective_coeffs.append(cost - SCHEDULED_REWARD)
+        
+        if choices:
+            model.AddAtMostOne(choices)
+    
+    for users in slot_users.values():
+        if len(users) > 1:
+            model.AddAtMostOne(users)
+    
+    # Rest days: at most one game per team in any rest_min_days window
+    rest_min = config.rest_min_days
+    for plays in team_plays.values():
+        plays.sort(key=lambda p: p[0])
+        days = [day for day, _ in plays]
+        for start_day in sorted(set(days)):
+            lo = bisect_left(days, start_day)
+            hi = bisect_left(days, start_day + rest_min)
+            if hi - lo > 1:
+                model.AddAtMostOne([var for _, var in plays[lo:hi]])
+    
+    model.Minimize(cp_model.LinearExpr.WeightedSum(objective_vars, objective_coeffs))
+    
+    solver = cp_model.CpSolver()
+    solver.parameters.max_time_in_seconds = CPSAT_TIME_LIMIT_SECONDS
+    solver.parameters.random_seed = config.seed
+    status = solver.Solve(model)
+    
+    if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+        return None
+    
+    return {
+        slot_idx: matchups[m_idx]
+        for (m_idx, slot_idx), var in placement.items()
+        if solver.Value(var)
+    }
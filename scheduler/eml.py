@@ -2,11 +2,59 @@
 E/M/L (Early/Mid/Late) classification for game times.
 """
 
+from bisect import bisect_left
 from datetime import time
-from typing import Union
+from functools import lru_cache
+from typing import Callable, Union
+import numpy as np
 from .models import EMLCategory, Weekday
 
 
+@lru_cache(maxsize=None)
+def make_eml_classifier(early_end: str = "21:59", mid_end: str = "22:34") -> Callable[[time], EMLCategory]:
+    """
+    Build an E/M/L classifier with the cutoff times parsed once.
+    
+    Args:
+        early_end: End time for early games (HH:MM format)
+        mid_end: End time for mid games (HH:MM format)
+    
+    Returns:
+        Callable: Function mapping a time object to its EMLCategory
+    """
+    # Cutoffs are inclusive, so bisect_left maps a time equal to a cutoff
+    # into the earlier category
+    bounds = (_time_key(time.fromisoformat(early_end)), _time_key(time.fromisoformat(mid_end)))
+    categories = (EMLCategory.EARLY, EMLCategory.MID, EMLCategory.LATE)
+    
+    def classify(dt: time) -> EMLCategory:
+        return categories[bisect_left(bounds, _time_key(dt))]
+    
+    return classify
+
+
+def classify_eml_array(time_keys: np.ndarray, early_end: str = "21:59", mid_end: str = "22:34") -> np.ndarray:
+    """
+    Classify many times of day at once.
+    
+    Args:
+        time_keys: Times of day as microseconds since midnight
+        early_end: End time for early games (HH:MM format)
+        mid_end: End time for mid games (HH:MM format)
+    
+    Returns:
+        np.ndarray: Object array of EMLCategory values
+    """
+    bounds = np.array([_time_key(time.fromisoformat(early_end)), _time_key(time.fromisoformat(mid_end))])
+    categories = np.array([EMLCategory.EARLY, EMLCategory.MID, EMLCategory.LATE], dtype=object)
+    return categories[np.searchsorted(bounds, time_keys, side='left')]
+
+
+def _time_key(t: time) -> int:
+    """Integer sort key for a time of day (microseconds since midnight)."""
+    return ((t.hour * 60 + t.minute) * 60 + t.second) * 1_000_000 + t.microsecond
+
+
 def eml_category(dt: Union[time, str], early_end: str = "21:59", mid_end: str = "22:34") -> EMLCategory:
     """
     Classify a time as Early, Mid, or Late based on end time.
@@ -22,15 +70,7 @@ def eml_category(dt: Union[time, str], early_end: str = "21:59", mid_end: str =
     if isinstance(dt, str):
         dt = time.fromisoformat(dt)
     
-    early_end_time = time.fromisoformat(early_end)
-    mid_end_time = time.fromisoformat(mid_end)
-    
-    if dt <= early_end_time:
-        return EMLCategory.EARLY
-    elif dt <= mid_end_time:
-        return EMLCategory.MID
-    else:
-        return EMLCategory.LATE
+    return make_eml_classifier(early_end, mid_end)(dt)
 
 
 def get_weekday(dt) -> Weekday:
@@ -79,8 +119,9 @@ def classify_slot_times(start_time, end_time, early_end: str = "21:59", mid_end:
         end_t = end_time
         weekday = None
     
-    start_eml = eml_category(start_t, early_end, mid_end)
-    end_eml = eml_category(end_t, early_end, mid_end)
+    classify = make_eml_classifier(early_end, mid_end)
+    start_eml = classify(start_t)
+    end_eml = classify(end_t)
     
     return start_eml, end_eml, weekday
 
@@ -120,11 +161,15 @@ def get_eml_balance_penalty(team_eml_counts) -> float:
     Calculate penalty for E/M/L imbalance.
     
     Args:
-        team_eml_counts: Dict of EML counts for the team
+        team_eml_counts: Dict of EML counts for the team, or a Team's
+            eml_counts_arr
     
     Returns:
         float: Penalty score (higher = more imbalanced)
     """
+    if isinstance(team_eml_counts, np.ndarray):
+        return int(team_eml_counts.max()) - int(team_eml_counts.min())
+    
     if not team_eml_counts:
         return 0.0
     
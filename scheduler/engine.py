@@ -2,20 +2,34 @@
 Core scheduling engine using greedy assignment with optimization.
 """
 
-import random
+import logging
+from collections import defaultdict
 from datetime import datetime, timedelta
+from operator import attrgetter
 from typing import List, Dict, Optional, Tuple
+import numpy as np
+import pandas as pd
 from .models import Slot, Team, Matchup, ScheduledGame, Schedule, EMLCategory
 from .config import SchedulerConfig
-from .eml import get_eml_balance_penalty
+from ._kernels import score_slots, NEVER_PLAYED
+from .cpsat import solve_assignment, HAS_ORTOOLS
+
+logger = logging.getLogger(__name__)
+
+# Search limits for the backtracking solver; past these it falls back to greedy
+BACKTRACK_MAX_DEPTH = 800
+BACKTRACK_NODE_LIMIT = 200000
 
 
 class SchedulingEngine:
-    """Core scheduling engine with greedy assignment."""
+    """Core scheduling engine with greedy or backtracking assignment."""
     
     def __init__(self, config: SchedulerConfig):
         self.config = config
-        random.seed(config.seed)
+        self._rng = np.random.default_rng(config.seed)
+        
+        # Teams already playing at each start time, for O(1) conflict checks
+        self._date_teams = defaultdict(set)
         
     def schedule(self, slots: List[Slot], matchups: List[Matchup], teams: Dict[str, Team]) -> Schedule:
         """
@@ -33,63 +47,229 @@ class SchedulingEngine:
         schedule.teams = teams
         schedule.slots = slots
         schedule.matchups = matchups
-        
-        # Sort slots chronologically
-        available_slots = sorted(slots, key=lambda x: x.start_time)
+        self._date_teams.clear()
+        
+        # Games are collected here and added to the schedule in one batch
+        placed: List[ScheduledGame] = []
+        
+        # Sort slots chronologically once; taken slots are masked out rather
+        # than removed so each step only flips a flag
+        slot_arr = np.array(sorted(slots, key=attrgetter('start_time')), dtype=object)
+        alive = np.ones(len(slot_arr), dtype=bool)
+        idx_of = {slot.slot_id: i for i, slot in enumerate(slot_arr)}
+        
+        # Parallel per-slot arrays for vectorized scoring: start time (int64 ns),
+        # calendar day ordinal and week number. Weeks are counted from the
+        # first slot's date so scores do not depend on when the run happens.
+        slot_start_ns = np.array([pd.Timestamp(slot.start_time).value for slot in slot_arr], dtype=np.int64)
+        self._slot_start_ns = slot_start_ns
+        self._slot_day = np.array([slot.start_time.date().toordinal() for slot in slot_arr], dtype=np.int64)
+        anchor = self._slot_day[0] if len(self._slot_day) else 0
+        self._slot_week = (self._slot_day - anchor) // 7 + 1
         
         # Sort matchups by priority (week target, then order)
-        unscheduled_matchups = sorted(matchups, key=lambda x: (x.week_target, x.order_in_week))
+        unscheduled_matchups = sorted(matchups, key=attrgetter('week_target', 'order_in_week'))
         
-        # Track scheduled games for constraint checking
-        scheduled_games = []
+        # Resolve team objects once per matchup instead of per lookup
+        for matchup in unscheduled_matchups:
+            matchup._home = teams[matchup.home_team]
+            matchup._away = teams[matchup.away_team]
+        
+        if self.config.solver == "cpsat" and not HAS_ORTOOLS:
+            logger.warning("OR-Tools is not installed, using greedy solver")
+        elif self.config.solver in ("backtrack", "cpsat"):
+            if self.config.solver == "backtrack":
+                assignment = self._backtracking_search(slot_arr, alive, unscheduled_matchups)
+            else:
+                domains = [self._find_eligible_slots(m, slot_arr, alive) for m in unscheduled_matchups]
+                assignment = solve_assignment(self._slot_day, self._slot_week, domains,
+                                              unscheduled_matchups, self.config)
+            
+            if assignment is not None:
+                # Place games chronologically so team state and rest days
+                # are accumulated in play order
+                for slot_idx in sorted(assignment, key=lambda i: self._slot_day[i]):
+                    self._place_game(placed, assignment[slot_idx], slot_arr[slot_idx])
+                    alive[slot_idx] = False
+                schedule.bulk_add(placed)
+                return schedule
+            
+            logger.warning("%s solver failed, falling back to greedy", self.config.solver)
         
         for matchup in unscheduled_matchups:
             # Find eligible slots for this matchup
-            eligible_slots = self._find_eligible_slots(
-                matchup, available_slots, scheduled_games, teams
+            eligible_idx = self._find_eligible_slots(
+                matchup, slot_arr, alive
             )
             
-            if not eligible_slots:
-                print(f"Warning: No eligible slots found for {matchup.matchup_id}")
+            if len(eligible_idx) == 0:
+                logger.warning("No eligible slots found for %s", matchup.matchup_id)
                 continue
             
             # Score and select best slot
-            best_slot, score = self._select_best_slot(matchup, eligible_slots, teams)
+            best_idx, score = self._select_best_slot(matchup, eligible_idx)
             
-            if best_slot:
-                # Schedule the game
-                game = self._create_scheduled_game(matchup, best_slot, teams)
-                schedule.add_game(game)
-                scheduled_games.append(game)
+            if best_idx is not None:
+                best_slot = slot_arr[best_idx]
                 
-                # Update team states
-                self._update_team_states(game, teams)
+                # Schedule the game
+                self._place_game(placed, matchup, best_slot)
                 
-                # Remove slot from available
-                available_slots.remove(best_slot)
+                # Mark slot as taken
+                alive[idx_of[best_slot.slot_id]] = False
                 
-                print(f"Scheduled {matchup.matchup_id} in {best_slot.slot_id} (score: {score:.2f})")
+                logger.info("Scheduled %s in %s (score: %.2f)", matchup.matchup_id, best_slot.slot_id, score)
             else:
-                print(f"Failed to schedule {matchup.matchup_id}")
+                logger.warning("Failed to schedule %s", matchup.matchup_id)
         
+        schedule.bulk_add(placed)
         return schedule
     
-    def _find_eligible_slots(self, matchup: Matchup, available_slots: List[Slot], 
-                           scheduled_games: List[ScheduledGame], teams: Dict[str, Team]) -> List[Slot]:
-        """Find slots eligible for a matchup."""
-        eligible = []
+    def _place_game(self, placed: List[ScheduledGame], matchup: Matchup, slot: Slot):
+        """Record a game for a matchup in a slot and update engine and team state."""
+        game = self._create_scheduled_game(matchup, slot)
+        placed.append(game)
+        self._date_teams[game.scheduled_date].update(game.matchup.teams)
+        
+        # Update team states
+        self._update_team_states(game)
+    
+    def _backtracking_search(self, slot_arr: np.ndarray, alive: np.ndarray,
+                             matchups: List[Matchup]) -> Optional[Dict[int, Matchup]]:
+        """
+        Assign every matchup a slot with MRV-ordered backtracking search.
+        
+        Each matchup's domain is a row of a boolean matchup x slot matrix.
+        After an assignment, forward checking removes the slot from every
+        other domain and removes slots within rest_min_days from matchups
+        sharing a team.
+        
+        Returns:
+            Dict mapping slot index to matchup, or None if the search fails
+            or exceeds its node or depth limit
+        """
+        if len(matchups) > BACKTRACK_MAX_DEPTH:
+            return None
+        
+        domains = np.zeros((len(matchups), len(slot_arr)), dtype=bool)
+        team_matchups = defaultdict(list)
+        for m_idx, matchup in enumerate(matchups):
+            domains[m_idx, self._find_eligible_slots(matchup, slot_arr, alive)] = True
+            team_matchups[matchup.home_team].append(m_idx)
+            team_matchups[matchup.away_team].append(m_idx)
+        
+        # Matchups sharing a team with each matchup
+        self._bt_matchups = matchups
+        self._bt_neighbors = [
+            sorted((set(team_matchups[m.home_team]) | set(team_matchups[m.away_team])) - {m_idx})
+            for m_idx, m in enumerate(matchups)
+        ]
+        self._bt_last_day = {
+            name: self._last_day(team)
+            for m in matchups for name, team in ((m.home_team, m._home), (m.away_team, m._away))
+        }
+        self._bt_nodes = BACKTRACK_NODE_LIMIT
+        
+        assignment = {}
+        if self._backtrack(assignment, set(range(len(matchups))), domains):
+            return {slot_idx: matchups[m_idx] for m_idx, slot_idx in assignment.items()}
+        return None
+    
+    def _backtrack(self, assignment: Dict[int, int], remaining_matchups: set,
+                   domains: np.ndarray) -> bool:
+        """Recursively extend a partial matchup -> slot assignment."""
+        if not remaining_matchups:
+            return True
+        
+        self._bt_nodes -= 1
+        if self._bt_nodes < 0:
+            return False
+        
+        # Minimum remaining values: branch on the most constrained matchup
+        remaining = np.fromiter(remaining_matchups, dtype=np.intp)
+        sizes = domains[remaining].sum(axis=1)
+        m_idx = int(remaining[sizes.argmin()])
+        if sizes.min() == 0:
+            return False
         
-        for slot in available_slots:
-            if self._is_slot_eligible(matchup, slot, scheduled_games, teams):
-                eligible.append(slot)
+        matchup = self._bt_matchups[m_idx]
+        candidates = np.flatnonzero(domains[m_idx])
+        scores = self._backtrack_scores(matchup, candidates)
+        
+        remaining_matchups.remove(m_idx)
+        others = np.fromiter(remaining_matchups, dtype=np.intp)
+        neighbors = [j for j in self._bt_neighbors[m_idx] if j in remaining_matchups]
+        rest_min = self.config.rest_min_days
+        
+        for slot_idx in candidates[np.argsort(scores, kind='stable')]:
+            day = self._slot_day[slot_idx]
+            saved_column = domains[others, slot_idx].copy()
+            saved_rows = domains[neighbors].copy()
+            
+            # Forward check: slot is taken, and neighbors must rest around it
+            domains[others, slot_idx] = False
+            if neighbors:
+                domains[neighbors] &= np.abs(self._slot_day - day) >= rest_min
+            
+            affected = others[saved_column]
+            if domains[affected].any(axis=1).all() and domains[neighbors].any(axis=1).all():
+                last_home = self._bt_last_day[matchup.home_team]
+                last_away = self._bt_last_day[matchup.away_team]
+                self._bt_last_day[matchup.home_team] = max(last_home, day)
+                self._bt_last_day[matchup.away_team] = max(last_away, day)
+                assignment[m_idx] = int(slot_idx)
+                
+                if self._backtrack(assignment, remaining_matchups, domains):
+                    return True
+                
+                del assignment[m_idx]
+                self._bt_last_day[matchup.home_team] = last_home
+                self._bt_last_day[matchup.away_team] = last_away
+            
+            domains[neighbors] = saved_rows
+            domains[others, slot_idx] = saved_column
+            
+            if self._bt_nodes < 0:
+                break
         
-        return eligible
+        remaining_matchups.add(m_idx)
+        return False
+    
+    def _backtrack_scores(self, matchup: Matchup, candidates: np.ndarray) -> np.ndarray:
+        """Score candidate slots for value ordering in the backtracking search."""
+        weights = self.config.weights
+        noise = self._rng.random(len(candidates)) * 0.1
+        
+        # Team-level E/M/L and home/away terms do not change the ordering
+        return score_slots(
+            self._slot_day[candidates],
+            self._slot_week[candidates],
+            self._bt_last_day[matchup.home_team],
+            self._bt_last_day[matchup.away_team],
+            self.config.rest_min_days,
+            self.config.max_gap_days,
+            weights.idle_urgency,
+            weights.week_rotation,
+            0.0,
+            0.0,
+            matchup.week_target,
+            noise,
+        )
     
-    def _is_slot_eligible(self, matchup: Matchup, slot: Slot, 
-                         scheduled_games: List[ScheduledGame], teams: Dict[str, Team]) -> bool:
+    def _find_eligible_slots(self, matchup: Matchup, slot_arr: np.ndarray,
+                           alive: np.ndarray) -> np.ndarray:
+        """Find indices of untaken slots eligible for a matchup."""
+        live_idx = np.flatnonzero(alive)
+        keep = [
+            i for i in live_idx
+            if self._is_slot_eligible(matchup, slot_arr[i])
+        ]
+        return np.array(keep, dtype=np.intp)
+    
+    def _is_slot_eligible(self, matchup: Matchup, slot: Slot) -> bool:
         """Check if a slot is eligible for a matchup."""
-        home_team = teams[matchup.home_team]
-        away_team = teams[matchup.away_team]
+        home_team = matchup._home
+        away_team = matchup._away
         
         # Check rest days constraint
         home_rest = home_team.get_rest_days(slot.start_time)
@@ -99,88 +279,58 @@ class SchedulingEngine:
             return False
         
         # Check for conflicts (same team already scheduled in this slot)
-        for game in scheduled_games:
-            if game.scheduled_date == slot.start_time:
-                if (matchup.home_team in game.matchup.teams or 
-                    matchup.away_team in game.matchup.teams):
-                    return False
+        teams_that_day = self._date_teams.get(slot.start_time)
+        if teams_that_day and (matchup.home_team in teams_that_day or
+                               matchup.away_team in teams_that_day):
+            return False
         
         return True
     
-    def _select_best_slot(self, matchup: Matchup, eligible_slots: List[Slot], 
-                         teams: Dict[str, Team]) -> Tuple[Optional[Slot], float]:
-        """Select the best slot for a matchup based on scoring."""
-        if not eligible_slots:
+    def _select_best_slot(self, matchup: Matchup,
+                         eligible_idx: np.ndarray) -> Tuple[Optional[int], float]:
+        """Select the best slot index for a matchup based on scoring."""
+        if len(eligible_idx) == 0:
             return None, 0.0
         
-        best_slot = None
-        best_score = float('inf')
-        
-        for slot in eligible_slots:
-            score = self._calculate_slot_score(matchup, slot, teams)
-            if score < best_score:
-                best_score = score
-                best_slot = slot
-        
-        return best_slot, best_score
-    
-    def _calculate_slot_score(self, matchup: Matchup, slot: Slot, teams: Dict[str, Team]) -> float:
-        """Calculate score for a slot-matchup combination (lower is better)."""
-        home_team = teams[matchup.home_team]
-        away_team = teams[matchup.away_team]
-        
-        score = 0.0
-        
-        # 1. Idle urgency (teams that haven't played in a while get priority)
-        home_idle = home_team.get_rest_days(slot.start_time)
-        away_idle = away_team.get_rest_days(slot.start_time)
-        
-        # Exponential penalty for long idle periods
-        home_idle_penalty = self._calculate_idle_penalty(home_idle)
-        away_idle_penalty = self._calculate_idle_penalty(away_idle)
-        score += self.config.weights.idle_urgency * (home_idle_penalty + away_idle_penalty)
-        
-        # 2. E/M/L balance
-        home_eml_penalty = get_eml_balance_penalty(home_team.eml_counts)
-        away_eml_penalty = get_eml_balance_penalty(away_team.eml_counts)
-        score += self.config.weights.eml_need * (home_eml_penalty + away_eml_penalty)
+        scores = self._calculate_slot_scores(matchup, eligible_idx)
+        best = int(scores.argmin())
         
-        # 3. Home/away balance
-        home_ha_penalty = abs(home_team.get_home_away_balance())
-        away_ha_penalty = abs(away_team.get_home_away_balance())
-        score += self.config.weights.home_away_bias * (home_ha_penalty + away_ha_penalty)
-        
-        # 4. Week rotation (prefer slots closer to target week)
-        week_diff = abs(matchup.week_target - self._get_week_number(slot.start_time))
-        score += self.config.weights.week_rotation * week_diff
-        
-        # 5. Random tie-breaker
-        score += random.random() * 0.1
-        
-        return score
+        return int(eligible_idx[best]), float(scores[best])
     
-    def _calculate_idle_penalty(self, idle_days: int) -> float:
-        """Calculate penalty for idle days (exponential increase near max_gap)."""
-        if idle_days <= self.config.rest_min_days:
-            return 0.0
-        
-        # Exponential penalty as we approach max_gap_days
-        if idle_days >= self.config.max_gap_days:
-            return 1000.0  # Very high penalty for exceeding max gap
-        
-        # Exponential curve from rest_min_days to max_gap_days
-        normalized = (idle_days - self.config.rest_min_days) / (self.config.max_gap_days - self.config.rest_min_days)
-        return normalized ** 2
+    def _calculate_slot_scores(self, matchup: Matchup, eligible_idx: np.ndarray) -> np.ndarray:
+        """Calculate scores for a matchup across eligible slots (lower is better)."""
+        home_team = matchup._home
+        away_team = matchup._away
+        weights = self.config.weights
+        
+        # Random tie-breaker, drawn in one call per matchup
+        noise = self._rng.random(len(eligible_idx)) * 0.1
+        
+        return score_slots(
+            self._slot_day[eligible_idx],
+            self._slot_week[eligible_idx],
+            self._last_day(home_team),
+            self._last_day(away_team),
+            self.config.rest_min_days,
+            self.config.max_gap_days,
+            weights.idle_urgency,
+            weights.week_rotation,
+            # Slot-invariant E/M/L and home/away terms, cached on the teams
+            weights.eml_need * (home_team.cached_eml_penalty + away_team.cached_eml_penalty),
+            weights.home_away_bias * (home_team.cached_ha_penalty + away_team.cached_ha_penalty),
+            matchup.week_target,
+            noise,
+        )
     
-    def _get_week_number(self, date: datetime) -> int:
-        """Get week number from date (simple implementation)."""
-        # This could be made more sophisticated based on league start date
-        return (date.date() - datetime.now().date()).days // 7 + 1
+    @staticmethod
+    def _last_day(team: Team) -> int:
+        """Get the day ordinal of the team's last game for the scoring kernel."""
+        return NEVER_PLAYED if team.last_played_day is None else team.last_played_day
     
-    def _create_scheduled_game(self, matchup: Matchup, slot: Slot, teams: Dict[str, Team]) -> ScheduledGame:
+    def _create_scheduled_game(self, matchup: Matchup, slot: Slot) -> ScheduledGame:
         """Create a scheduled game."""
-        home_team = teams[matchup.home_team]
-        away_team = teams[matchup.away_team]
+        home_team = matchup._home
+        away_team = matchup._away
         
         days_since_home = home_team.get_rest_days(slot.start_time)
         days_since_away = away_team.get_rest_days(slot.start_time)
@@ -193,10 +343,10 @@ class SchedulingEngine:
             days_since_away_played=days_since_away
         )
     
-    def _update_team_states(self, game: ScheduledGame, teams: Dict[str, Team]):
+    def _update_team_states(self, game: ScheduledGame):
         """Update team states after scheduling a game."""
-        home_team = teams[game.matchup.home_team]
-        away_team = teams[game.matchup.away_team]
+        home_team = game.matchup._home
+        away_team = game.matchup._away
         
         home_team.update_after_game(game.scheduled_date, True, game.slot.eml_category)
         away_team.update_after_game(game.scheduled_date, False, game.slot.eml_category)
@@ -244,41 +394,33 @@ def validate_schedule(schedule: Schedule, config: SchedulerConfig) -> Dict[str,
         violations['errors'].append("No games scheduled")
         return violations
     
-    # Check rest day violations
-    for game in schedule.games:
-        home_team = schedule.teams[game.matchup.home_team]
-        away_team = schedule.teams[game.matchup.away_team]
-        
-        home_rest = home_team.get_rest_days(game.scheduled_date)
-        away_rest = away_team.get_rest_days(game.scheduled_date)
-        
-        if home_rest < config.rest_min_days:
-            violations['errors'].append(
-                f"Home team {game.matchup.home_team} has insufficient rest: {home_rest} days"
-            )
-        
-        if away_rest < config.rest_min_days:
-            violations['errors'].append(
-                f"Away team {game.matchup.away_team} has insufficient rest: {away_rest} days"
-            )
+    # One row per (game, team) so both checks are vectorized groupby passes
+    games = pd.DataFrame({
+        'date': [game.scheduled_date.date() for game in schedule.games],
+        'home': [game.matchup.home_team for game in schedule.games],
+        'away': [game.matchup.away_team for game in schedule.games],
+    })
+    games['day'] = [date.toordinal() for date in games['date']]
+    plays = games.reset_index().melt(
+        id_vars=['index', 'date', 'day'], value_vars=['home', 'away'],
+        var_name='role', value_name='team'
+    ).sort_values('index', kind='stable')
     
-    # Check for scheduling conflicts
-    games_by_date = {}
-    for game in schedule.games:
-        date = game.scheduled_date.date()
-        if date not in games_by_date:
-            games_by_date[date] = []
-        games_by_date[date].append(game)
+    # Check rest day violations from each team's own sorted play dates, so the
+    # result does not depend on the teams' current mutable state
+    by_team = plays.sort_values(['team', 'day'], kind='stable')
+    rest_days = by_team.groupby('team', sort=False)['day'].diff()
+    for row, rest in zip(by_team[rest_days < config.rest_min_days].itertuples(),
+                         rest_days[rest_days < config.rest_min_days]):
+        violations['errors'].append(
+            f"{row.role.capitalize()} team {row.team} has insufficient rest: {int(rest)} days"
+        )
     
-    for date, games in games_by_date.items():
-        teams_on_date = set()
-        for game in games:
-            for team in game.matchup.teams:
-                if team in teams_on_date:
-                    violations['errors'].append(
-                        f"Team {team} scheduled multiple games on {date}"
-                    )
-                teams_on_date.add(team)
+    # Check for scheduling conflicts
+    for row in plays[plays.duplicated(['date', 'team'])].itertuples():
+        violations['errors'].append(
+            f"Team {row.team} scheduled multiple games on {row.date}"
+        )
     
     # Check for unscheduled matchups
     scheduled_matchup_ids = {game.matchup.matchup_id for game in schedule.games}
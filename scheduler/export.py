@@ -2,11 +2,23 @@
 Export functionality for writing schedules to Excel.
 """
 
+import logging
+from collections import Counter
+from itertools import groupby
+import numpy as np
 import pandas as pd
-from datetime import datetime
+import xlsxwriter
+from datetime import datetime, date
 from typing import Dict, List, Optional
 from .models import Schedule, EMLCategory, Weekday
 from .config import SchedulerConfig
+from ._openpyxl_writer import WriteOnlyWorkbook
+from ._kernels import team_gap_stats
+
+logger = logging.getLogger(__name__)
+
+# Day ordinal of 1970-01-01, the datetime64 epoch
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
 
 
 def write_excel(schedule: Schedule, config: SchedulerConfig, output_path: str) -> None:
@@ -18,40 +30,126 @@ def write_excel(schedule: Schedule, config: SchedulerConfig, output_path: str) -
         config: Scheduler configuration
         output_path: Path to output Excel file
     """
-    print(f"Writing schedule to {output_path}")
+    logger.info("Writing schedule to %s", output_path)
     
-    with pd.ExcelWriter(output_path, engine='xlsxwriter') as writer:
+    # Both engines stream each row to disk once written, so every sheet
+    # below must be written strictly top to bottom
+    if config.excel.engine == "openpyxl_writeonly":
+        workbook = WriteOnlyWorkbook(output_path)
+    else:
+        workbook = xlsxwriter.Workbook(output_path, {'constant_memory': True})
+    formats = _create_formats(workbook)
+    
+    try:
         # Write main schedule
-        _write_final_schedule(schedule, config, writer)
+        _write_final_schedule(schedule, config, workbook, formats)
         
         # Write summary sheets if requested
         if config.excel.include_summaries:
-            _write_eml_spread(schedule, config, writer)
-            _write_weekday_spread(schedule, config, writer)
-            _write_team_summary(schedule, config, writer)
-            _write_gap_analysis(schedule, config, writer)
+            team_games = _team_games_frame(schedule)
+            _write_eml_spread(schedule, config, workbook, formats)
+            _write_weekday_spread(schedule, config, workbook, formats, team_games)
+            _write_team_summary(schedule, config, workbook, formats, team_games)
+            _write_gap_analysis(schedule, config, workbook, formats, team_games)
+    finally:
+        workbook.close()
+    
+    logger.info("Schedule exported successfully to %s", output_path)
+
+
+def _create_formats(workbook) -> Dict[str, object]:
+    """Create the cell formats shared by every sheet."""
+    return {
+        'header': workbook.add_format({'bold': True, 'border': 1}),
+        'schedule_header': workbook.add_format({
+            'bold': True,
+            'text_wrap': True,
+            'valign': 'top',
+            'fg_color': '#D7E4BC',
+            'border': 1
+        }),
+        'date': workbook.add_format({'num_format': 'mm/dd/yyyy'}),
+        'time': workbook.add_format({'num_format': 'hh:mm AM/PM'}),
+        'violation': workbook.add_format({'bg_color': '#FFC7CE'})
+    }
+
+
+def _write_table(worksheet, df: pd.DataFrame, header_format, start_row: int = 0,
+                 column_formats: Optional[Dict[str, object]] = None) -> int:
+    """
+    Write a DataFrame's header and rows in order, bypassing DataFrame.to_excel.
+    
+    Args:
+        worksheet: Target xlsxwriter worksheet
+        df: Data to write
+        header_format: Format for the header row
+        start_row: Row index of the header
+        column_formats: Optional cell format per column name
+    
+    Returns:
+        int: Index of the first row after the table
+    """
+    worksheet.write_row(start_row, 0, df.columns.tolist(), header_format)
+    
+    # Missing values are written as blank cells
+    rows = df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+    
+    if not column_formats:
+        for row_idx, row in enumerate(rows, start=start_row + 1):
+            worksheet.write_row(row_idx, 0, row)
+    else:
+        cell_formats = [column_formats.get(col) for col in df.columns]
+        for row_idx, row in enumerate(rows, start=start_row + 1):
+            for col_idx, (value, cell_format) in enumerate(zip(row, cell_formats)):
+                worksheet.write(row_idx, col_idx, value, cell_format)
     
-    print(f"Schedule exported successfully to {output_path}")
+    return start_row + len(df) + 1
 
 
-def _write_final_schedule(schedule: Schedule, config: SchedulerConfig, writer) -> None:
+def _team_games_frame(schedule: Schedule) -> pd.DataFrame:
+    """
+    Build one row per (team, game), ordered by team and then start time.
+    
+    Columns are Team, Date (calendar date of the game), Day (weekday name)
+    and Gap (days since the team's previous game, NaN for its first game).
+    Built once and shared by the summary sheets.
+    """
+    games = schedule.games
+    starts = pd.to_datetime([game.scheduled_date for game in games], utc=True)
+    ordinals = np.array([game.scheduled_date.date().toordinal() for game in games], dtype=np.int64)
+    days = [game.slot.weekday.value for game in games]
+    
+    df = pd.DataFrame({
+        'Team': [game.matchup.home_team for game in games] + [game.matchup.away_team for game in games],
+        'Start': starts.append(starts),
+        'Seq': np.tile(np.arange(len(games)), 2),
+        'Ordinal': np.tile(ordinals, 2),
+        'Day': days * 2
+    })
+    
+    # Ties on start time keep schedule order, as a stable per-team sort did
+    df = df.sort_values(['Team', 'Start', 'Seq']).reset_index(drop=True)
+    
+    # Gaps are day-ordinal differences; a team's first game has none
+    ordinal = df['Ordinal'].to_numpy()
+    team = df['Team'].to_numpy()
+    gaps = np.full(len(df), np.nan)
+    if len(df) > 1:
+        gaps[1:] = np.where(team[1:] == team[:-1], np.diff(ordinal), np.nan)
+    
+    df['Date'] = (ordinal - EPOCH_ORDINAL).astype('datetime64[D]')
+    df['Gap'] = gaps
+    return df[['Team', 'Date', 'Day', 'Gap']]
+
+
+def _write_final_schedule(schedule: Schedule, config: SchedulerConfig, workbook, formats: Dict) -> None:
     """Write the main schedule sheet."""
     df = schedule.to_dataframe()
     
     if df.empty:
-        print("Warning: No games to export")
+        logger.warning("No games to export")
         return
     
-    # Format the dataframe
-    df = df.copy()
-    
-    # Format time columns
-    df['Start Time'] = df['Start Time'].apply(lambda x: x.strftime('%I:%M %p'))
-    df['End Time'] = df['End Time'].apply(lambda x: x.strftime('%I:%M %p'))
-    
-    # Format date column
-    df['Date'] = df['Date'].apply(lambda x: x.strftime('%m/%d/%Y'))
-    
     # Reorder columns for better readability
     column_order = [
         'Week', 'Order', 'Date', 'Day', 'Start Time', 'End Time', 'Resource',
@@ -61,19 +159,21 @@ def _write_final_schedule(schedule: Schedule, config: SchedulerConfig, writer) -
     
     df = df[column_order]
     
-    # Write to Excel
+    # Formatting goes on first: with constant_memory the rows are final
+    # as soon as they are written
     sheet_name = config.excel.sheets.get('final_name', 'Final Schedule')
-    df.to_excel(writer, sheet_name=sheet_name, index=False)
-    
-    # Get the worksheet for formatting
-    worksheet = writer.sheets[sheet_name]
-    workbook = writer.book
-    
-    # Add formatting
-    _format_schedule_worksheet(worksheet, workbook, df)
+    worksheet = workbook.add_worksheet(sheet_name)
+    _format_schedule_worksheet(worksheet, formats, df)
+    
+    # Dates and times are written natively and displayed via num_format
+    _write_table(worksheet, df, formats['schedule_header'], column_formats={
+        'Date': formats['date'],
+        'Start Time': formats['time'],
+        'End Time': formats['time']
+    })
 
 
-def _write_eml_spread(schedule: Schedule, config: SchedulerConfig, writer) -> None:
+def _write_eml_spread(schedule: Schedule, config: SchedulerConfig, workbook, formats: Dict) -> None:
     """Write E/M/L distribution summary."""
     sheet_name = config.excel.sheets.get('eml_spread', 'E-M-L Spread')
     
@@ -93,11 +193,8 @@ def _write_eml_spread(schedule: Schedule, config: SchedulerConfig, writer) -> No
     df = pd.DataFrame(eml_data)
     df = df.sort_values(['Division', 'Team'])
     
-    df.to_excel(writer, sheet_name=sheet_name, index=False)
-    
-    # Add summary statistics
-    worksheet = writer.sheets[sheet_name]
-    workbook = writer.book
+    worksheet = workbook.add_worksheet(sheet_name)
+    _write_table(worksheet, df, formats['header'])
     
     # Add summary at the bottom
     summary_row = len(df) + 3
@@ -106,66 +203,54 @@ def _write_eml_spread(schedule: Schedule, config: SchedulerConfig, writer) -> No
     worksheet.write(summary_row + 2, 0, f'Teams with Perfect Balance: {(df["Balance Score"] == 0).sum()}')
 
 
-def _write_weekday_spread(schedule: Schedule, config: SchedulerConfig, writer) -> None:
+def _write_weekday_spread(schedule: Schedule, config: SchedulerConfig, workbook, formats: Dict,
+                          team_games: pd.DataFrame) -> None:
     """Write weekday distribution summary."""
     sheet_name = config.excel.sheets.get('weekday_spread', 'Weekday Spread')
     
     # Calculate weekday distribution by team
-    weekday_data = []
-    for team_name, team in schedule.teams.items():
-        team_games = schedule.get_team_schedule(team_name)
-        weekday_counts = {weekday.value: 0 for weekday in Weekday}
-        
-        for game in team_games:
-            weekday = game.slot.weekday.value
-            weekday_counts[weekday] += 1
-        
-        row_data = {'Team': team_name, 'Division': team.division}
-        row_data.update(weekday_counts)
-        weekday_data.append(row_data)
+    weekday_names = [weekday.value for weekday in Weekday]
+    counts = pd.crosstab(team_games['Team'], team_games['Day'])
+    counts = counts.reindex(index=list(schedule.teams), columns=weekday_names, fill_value=0)
     
-    df = pd.DataFrame(weekday_data)
+    df = pd.DataFrame({
+        'Team': list(schedule.teams),
+        'Division': [team.division for team in schedule.teams.values()]
+    })
+    df = pd.concat([df, counts.reset_index(drop=True)], axis=1)
     df = df.sort_values(['Division', 'Team'])
     
-    df.to_excel(writer, sheet_name=sheet_name, index=False)
-    
-    # Add summary statistics
-    worksheet = writer.sheets[sheet_name]
-    workbook = writer.book
+    worksheet = workbook.add_worksheet(sheet_name)
+    _write_table(worksheet, df, formats['header'])
     
     # Calculate overall weekday distribution
-    overall_weekdays = {weekday.value: 0 for weekday in Weekday}
-    for game in schedule.games:
-        weekday = game.slot.weekday.value
-        overall_weekdays[weekday] += 1
+    overall_weekdays = Counter(game.slot.weekday for game in schedule.games)
     
     summary_row = len(df) + 3
     worksheet.write(summary_row, 0, 'Overall Weekday Distribution')
-    for i, (weekday, count) in enumerate(overall_weekdays.items()):
-        worksheet.write(summary_row + 1, i + 2, weekday)
-        worksheet.write(summary_row + 2, i + 2, count)
+    worksheet.write_row(summary_row + 1, 2, weekday_names)
+    worksheet.write_row(summary_row + 2, 2, [overall_weekdays[weekday] for weekday in Weekday])
 
 
-def _write_team_summary(schedule: Schedule, config: SchedulerConfig, writer) -> None:
+def _write_team_summary(schedule: Schedule, config: SchedulerConfig, workbook, formats: Dict,
+                        team_games: pd.DataFrame) -> None:
     """Write team summary statistics."""
     sheet_name = 'Team Summary'
     
+    # The frame is sorted by team, so each team is one contiguous run;
+    # gap statistics for all runs come from one kernel call
+    names = team_games['Team'].to_numpy()
+    dates = team_games['Date']
+    starts = np.flatnonzero(np.r_[True, names[1:] != names[:-1]]) if len(names) else np.empty(0, dtype=np.int64)
+    offsets = np.append(starts, len(names)).astype(np.int64)
+    ordinals = dates.to_numpy().astype('datetime64[D]').astype(np.int64)
+    mean_gap, min_gap, max_gap = team_gap_stats(ordinals, offsets)
+    run_of = {name: t for t, name in enumerate(names[starts].tolist())}
+    
     # Calculate team statistics
     team_data = []
     for team_name, team in schedule.teams.items():
-        team_games = schedule.get_team_schedule(team_name)
-        team_games.sort(key=lambda x: x.scheduled_date)
-        
-        # Calculate gaps
-        gaps = []
-        for i in range(len(team_games) - 1):
-            gap = (team_games[i + 1].scheduled_date.date() - 
-                   team_games[i].scheduled_date.date()).days
-            gaps.append(gap)
-        
-        avg_gap = sum(gaps) / len(gaps) if gaps else 0
-        max_gap = max(gaps) if gaps else 0
-        min_gap = min(gaps) if gaps else 0
+        t = run_of.get(team_name)
         
         team_data.append({
             'Team': team_name,
@@ -175,60 +260,47 @@ def _write_team_summary(schedule: Schedule, config: SchedulerConfig, writer) ->
             'Away Games': team.away_count,
             'Home/Away Balance': team.get_home_away_balance(),
             'EML Balance Score': team.get_eml_balance_score(),
-            'Average Gap': avg_gap,
-            'Max Gap': max_gap,
-            'Min Gap': min_gap,
-            'First Game': team_games[0].scheduled_date.date() if team_games else None,
-            'Last Game': team_games[-1].scheduled_date.date() if team_games else None
+            'Average Gap': mean_gap[t] if t is not None else 0,
+            'Max Gap': int(max_gap[t]) if t is not None else 0,
+            'Min Gap': int(min_gap[t]) if t is not None else 0,
+            'First Game': dates.iat[offsets[t]] if t is not None else None,
+            'Last Game': dates.iat[offsets[t + 1] - 1] if t is not None else None
         })
     
     df = pd.DataFrame(team_data)
     df = df.sort_values(['Division', 'Team'])
     
-    # Format date columns
-    df['First Game'] = df['First Game'].apply(lambda x: x.strftime('%m/%d/%Y') if x else '')
-    df['Last Game'] = df['Last Game'].apply(lambda x: x.strftime('%m/%d/%Y') if x else '')
-    
-    df.to_excel(writer, sheet_name=sheet_name, index=False)
+    worksheet = workbook.add_worksheet(sheet_name)
+    _write_table(worksheet, df, formats['header'], column_formats={
+        'First Game': formats['date'],
+        'Last Game': formats['date']
+    })
 
 
-def _write_gap_analysis(schedule: Schedule, config: SchedulerConfig, writer) -> None:
+def _write_gap_analysis(schedule: Schedule, config: SchedulerConfig, workbook, formats: Dict,
+                        team_games: pd.DataFrame) -> None:
     """Write gap analysis summary."""
     sheet_name = 'Gap Analysis'
     
-    # Collect all gaps
-    all_gaps = []
-    gap_details = []
-    
-    for team_name, team in schedule.teams.items():
-        team_games = schedule.get_team_schedule(team_name)
-        team_games.sort(key=lambda x: x.scheduled_date)
-        
-        for i in range(len(team_games) - 1):
-            gap = (team_games[i + 1].scheduled_date.date() - 
-                   team_games[i].scheduled_date.date()).days
-            all_gaps.append(gap)
-            
-            gap_details.append({
-                'Team': team_name,
-                'Division': team.division,
-                'Gap': gap,
-                'Game 1': team_games[i].scheduled_date.date(),
-                'Game 2': team_games[i + 1].scheduled_date.date(),
-                'Violation': gap > config.max_gap_days
-            })
+    # Each row with a Gap closes a consecutive pair of one team's games
+    team_games = team_games[team_games['Team'].isin(schedule.teams)]
+    previous_date = team_games.groupby('Team', sort=False)['Date'].shift()
+    pairs = team_games['Gap'].notna()
     
-    if not all_gaps:
+    if not pairs.any():
         return
     
+    all_gaps = team_games.loc[pairs, 'Gap'].astype(int)
+    divisions = {name: team.division for name, team in schedule.teams.items()}
+    
     # Create gap statistics
     gap_stats = {
         'Total Gaps': len(all_gaps),
-        'Average Gap': sum(all_gaps) / len(all_gaps),
-        'Min Gap': min(all_gaps),
-        'Max Gap': max(all_gaps),
-        'Gaps > Max': sum(1 for gap in all_gaps if gap > config.max_gap_days),
-        'Gaps < Min Rest': sum(1 for gap in all_gaps if gap < config.rest_min_days),
+        'Average Gap': all_gaps.mean(),
+        'Min Gap': int(all_gaps.min()),
+        'Max Gap': int(all_gaps.max()),
+        'Gaps > Max': int((all_gaps > config.max_gap_days).sum()),
+        'Gaps < Min Rest': int((all_gaps < config.rest_min_days).sum()),
         'Target Gap': config.target_gap_days,
         'Max Gap Limit': config.max_gap_days,
         'Min Rest Days': config.rest_min_days
@@ -236,33 +308,28 @@ def _write_gap_analysis(schedule: Schedule, config: SchedulerConfig, writer) ->
     
     # Write gap statistics
     stats_df = pd.DataFrame([gap_stats])
-    stats_df.to_excel(writer, sheet_name=sheet_name, index=False)
+    worksheet = workbook.add_worksheet(sheet_name)
+    _write_table(worksheet, stats_df, formats['header'])
     
     # Write gap details
-    details_df = pd.DataFrame(gap_details)
+    details_df = pd.DataFrame({
+        'Team': team_games.loc[pairs, 'Team'],
+        'Division': team_games.loc[pairs, 'Team'].map(divisions),
+        'Gap': all_gaps,
+        'Game 1': previous_date[pairs],
+        'Game 2': team_games.loc[pairs, 'Date'],
+        'Violation': all_gaps > config.max_gap_days
+    })
     details_df = details_df.sort_values(['Team', 'Game 1'])
     
-    # Format date columns
-    details_df['Game 1'] = details_df['Game 1'].apply(lambda x: x.strftime('%m/%d/%Y'))
-    details_df['Game 2'] = details_df['Game 2'].apply(lambda x: x.strftime('%m/%d/%Y'))
-    
-    details_df.to_excel(writer, sheet_name=sheet_name, startrow=len(stats_df) + 3, index=False)
+    _write_table(worksheet, details_df, formats['header'], start_row=len(stats_df) + 3, column_formats={
+        'Game 1': formats['date'],
+        'Game 2': formats['date']
+    })
 
 
-def _format_schedule_worksheet(worksheet, workbook, df: pd.DataFrame) -> None:
-    """Apply formatting to the schedule worksheet."""
-    # Define formats
-    header_format = workbook.add_format({
-        'bold': True,
-        'text_wrap': True,
-        'valign': 'top',
-        'fg_color': '#D7E4BC',
-        'border': 1
-    })
-    
-    date_format = workbook.add_format({'num_format': 'mm/dd/yyyy'})
-    time_format = workbook.add_format({'num_format': 'hh:mm AM/PM'})
-    
+def _format_schedule_worksheet(worksheet, formats: Dict, df: pd.DataFrame) -> None:
+    """Set column widths and violation highlighting on the schedule worksheet."""
     # Set column widths
     column_widths = {
         'Week': 6,
@@ -280,28 +347,21 @@ def _format_schedule_worksheet(worksheet, workbook, df: pd.DataFrame) -> None:
         'Days Since Away Played': 18
     }
     
-    for i, col in enumerate(df.columns):
-        worksheet.set_column(i, i, column_widths.get(col, 12))
-    
-    # Apply header format
-    for col_num, value in enumerate(df.columns.values):
-        worksheet.write(0, col_num, value, header_format)
+    # One set_column call per run of adjacent columns with the same width
+    widths = [column_widths.get(col, 12) for col in df.columns]
+    first = 0
+    for width, run in groupby(widths):
+        last = first + len(list(run)) - 1
+        worksheet.set_column(first, last, width)
+        first = last + 1
     
     # Apply conditional formatting for violations
-    if 'Days Since Home Played' in df.columns:
-        home_col = df.columns.get_loc('Days Since Home Played')
-        worksheet.conditional_format(1, home_col, len(df), home_col, {
-            'type': 'cell',
-            'criteria': '>',
-            'value': 12,
-            'format': workbook.add_format({'bg_color': '#FFC7CE'})
-        })
-    
-    if 'Days Since Away Played' in df.columns:
-        away_col = df.columns.get_loc('Days Since Away Played')
-        worksheet.conditional_format(1, away_col, len(df), away_col, {
-            'type': 'cell',
-            'criteria': '>',
-            'value': 12,
-            'format': workbook.add_format({'bg_color': '#FFC7CE'})
-        })
+    for col in ('Days Since Home Played', 'Days Since Away Played'):
+        if col in df.columns:
+            col_idx = df.columns.get_loc(col)
+            worksheet.conditional_format(1, col_idx, len(df), col_idx, {
+                'type': 'cell',
+                'criteria': '>',
+                'value': 12,
+                'format': formats['violation']
+            })
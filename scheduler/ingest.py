@@ -2,13 +2,58 @@
 Data ingestion for the league scheduler.
 """
 
+import logging
+from collections import Counter, defaultdict
+import numpy as np
 import pandas as pd
-import pytz
+from openpyxl import load_workbook
+from pathlib import Path
+from zoneinfo import ZoneInfo
 from datetime import datetime
 from typing import List, Dict, Optional
 from .models import Slot, Team, Weekday, EMLCategory
 from .config import SchedulerConfig
-from .eml import classify_slot_times
+from .eml import classify_eml_array
+
+logger = logging.getLogger(__name__)
+
+
+def _read_sheet(excel_path: str) -> pd.DataFrame:
+    """
+    Read the first worksheet of a workbook into a DataFrame.
+    
+    .xlsx files are streamed with openpyxl in read-only mode, skipping
+    pd.read_excel's per-cell conversion; other formats use pd.read_excel.
+    
+    Args:
+        excel_path: Path to the workbook
+    
+    Returns:
+        pd.DataFrame: Sheet contents with the first row as the header
+    """
+    if Path(excel_path).suffix.lower() not in ('.xlsx', '.xlsm'):
+        return pd.read_excel(excel_path)
+    
+    workbook = load_workbook(excel_path, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, None)
+        records = list(rows)
+    finally:
+        workbook.close()
+    
+    if header is None:
+        return pd.DataFrame()
+    
+    # Drop trailing blank rows and unnamed trailing columns, as read_excel does
+    while records and all(value is None for value in records[-1]):
+        records.pop()
+    width = len(header)
+    while width and header[width - 1] is None:
+        width -= 1
+    
+    df = pd.DataFrame([row[:width] for row in records], columns=list(header[:width]))
+    return df.fillna(np.nan)
 
 
 def load_slots(excel_path: str, config: SchedulerConfig) -> List[Slot]:
@@ -23,7 +68,7 @@ def load_slots(excel_path: str, config: SchedulerConfig) -> List[Slot]:
         List[Slot]: List of available slots
     """
     # Read Excel file
-    df = pd.read_excel(excel_path)
+    df = _read_sheet(excel_path)
     
     # Validate required columns exist
     required_columns = [config.columns['start'], config.columns['end'], config.columns['resource']]
@@ -32,45 +77,38 @@ def load_slots(excel_path: str, config: SchedulerConfig) -> List[Slot]:
     if missing_columns:
         raise ValueError(f"Missing required columns: {missing_columns}. Found columns: {list(df.columns)}")
     
-    # Convert to timezone-aware datetime
-    tz = pytz.timezone(config.timezone)
-    
-    slots = []
-    for _, row in df.iterrows():
-        try:
-            # Parse start and end times
-            start_time = pd.to_datetime(row[config.columns['start']])
-            end_time = pd.to_datetime(row[config.columns['end']])
-            
-            # Make timezone-aware
-            if start_time.tz is None:
-                start_time = tz.localize(start_time)
-            if end_time.tz is None:
-                end_time = tz.localize(end_time)
-            
-            # Classify E/M/L and weekday
-            start_eml, end_eml, weekday = classify_slot_times(
-                start_time, 
-                end_time,
-                config.eml_cutoffs.early_end,
-                config.eml_cutoffs.mid_end
-            )
-            
-            # Create slot
-            slot = Slot(
-                start_time=start_time,
-                end_time=end_time,
-                resource=row[config.columns['resource']],
-                slot_type="Game Rental",  # Default type
-                weekday=weekday,
-                eml_category=end_eml  # Use end time for E/M/L classification
-            )
-            
-            slots.append(slot)
-            
-        except Exception as e:
-            print(f"Warning: Could not parse row {row.name}: {e}")
-            continue
+    # Convert to timezone-aware datetime, a whole column at a time
+    tz = ZoneInfo(config.timezone)
+    starts = _parse_datetime_column(df[config.columns['start']], tz)
+    ends = _parse_datetime_column(df[config.columns['end']], tz)
+    
+    bad_rows = starts.isna() | ends.isna()
+    if bad_rows.any():
+        logger.warning("Could not parse %s rows: %s", int(bad_rows.sum()), df.index[bad_rows].tolist())
+        starts = starts[~bad_rows]
+        ends = ends[~bad_rows]
+    resources = df.loc[starts.index, config.columns['resource']].to_numpy()
+    
+    # Classify weekday and E/M/L (end time drives E/M/L)
+    weekday_values = np.array(list(Weekday), dtype=object)
+    weekdays = weekday_values[starts.dt.weekday.to_numpy()]
+    end_fields = [ends.dt.hour, ends.dt.minute, ends.dt.second, ends.dt.microsecond]
+    hour, minute, second, micro = (f.to_numpy(dtype=np.int64) for f in end_fields)
+    end_keys = ((hour * 60 + minute) * 60 + second) * 1_000_000 + micro
+    emls = classify_eml_array(end_keys, config.eml_cutoffs.early_end, config.eml_cutoffs.mid_end)
+    
+    slots = [
+        Slot(
+            start_time=start_time,
+            end_time=end_time,
+            resource=resource,
+            slot_type="Game Rental",  # Default type
+            weekday=weekday,
+            eml_category=eml  # Use end time for E/M/L classification
+        )
+        for start_time, end_time, resource, weekday, eml
+        in zip(starts, ends, resources, weekdays, emls)
+    ]
     
     # Sort by start time
     slots.sort(key=lambda x: x.start_time)
@@ -78,6 +116,24 @@ def load_slots(excel_path: str, config: SchedulerConfig) -> List[Slot]:
     return slots
 
 
+def _parse_datetime_column(values: pd.Series, tz) -> pd.Series:
+    """
+    Parse a column to timezone-aware datetimes; unparseable values become NaT.
+    
+    Naive times are localized as per-value localization of Timestamps did:
+    ambiguous times resolve to daylight time and nonexistent times move
+    forward by an hour.
+    """
+    parsed = pd.to_datetime(values, errors='coerce', format='mixed')
+    if parsed.dt.tz is None:
+        parsed = parsed.dt.tz_localize(
+            tz,
+            ambiguous=np.ones(len(parsed), dtype=bool),
+            nonexistent=pd.Timedelta(hours=1)
+        )
+    return parsed
+
+
 def create_teams_from_config(config: SchedulerConfig) -> Dict[str, Team]:
     """
     Create Team objects from configuration.
@@ -116,20 +172,27 @@ def load_matchups_from_excel(excel_path: str, config: SchedulerConfig) -> List['
     """
     from .models import Matchup
     
-    df = pd.read_excel(excel_path)
+    df = _read_sheet(excel_path)
     
-    matchups = []
-    for _, row in df.iterrows():
-        matchup = Matchup(
-            home_team=row['Home Team'],
-            away_team=row['Away Team'],
-            division=row.get('Division', 'Unknown'),
-            week_target=row.get('Week', 1),
-            order_in_week=row.get('Order', 1)
-        )
-        matchups.append(matchup)
+    # Optional columns are filled once rather than defaulted per row
+    df = df.assign(**{
+        col: default
+        for col, default in [('Division', 'Unknown'), ('Week', 1), ('Order', 1)]
+        if col not in df.columns
+    })
     
-    return matchups
+    columns = ['Home Team', 'Away Team', 'Division', 'Week', 'Order']
+    return [
+        Matchup(
+            home_team=home_team,
+            away_team=away_team,
+            division=division,
+            week_target=week,
+            order_in_week=order
+        )
+        for home_team, away_team, division, week, order
+        in df[columns].itertuples(index=False, name=None)
+    ]
 
 
 def validate_slots(slots: List[Slot]) -> Dict[str, List[str]]:
@@ -151,28 +214,45 @@ def validate_slots(slots: List[Slot]) -> Dict[str, List[str]]:
         issues['errors'].append("No slots found")
         return issues
     
-    # Check for overlapping slots
-    for i, slot1 in enumerate(slots):
-        for j, slot2 in enumerate(slots[i+1:], i+1):
-            if (slot1.resource == slot2.resource and 
-                slot1.start_time < slot2.end_time and 
-                slot2.start_time < slot1.end_time):
-                issues['warnings'].append(
-                    f"Overlapping slots: {slot1.slot_id} and {slot2.slot_id}"
-                )
+    # Check for overlapping slots: sweep each resource's slots in start
+    # order, comparing only against slots that have not yet ended
+    by_resource = defaultdict(list)
+    for i, slot in enumerate(slots):
+        if slot.resource == slot.resource:  # NaN resources never overlap
+            by_resource[slot.resource].append(i)
+    
+    overlaps = []
+    for indices in by_resource.values():
+        indices.sort(key=lambda i: slots[i].start_time)
+        active = []
+        for j in indices:
+            slot2 = slots[j]
+            active = [i for i in active if slots[i].end_time > slot2.start_time]
+            for i in active:
+                if slot2.start_time < slots[i].end_time and slots[i].start_time < slot2.end_time:
+                    overlaps.append((min(i, j), max(i, j)))
+            active.append(j)
+    
+    # Report pairs in input order
+    for i, j in sorted(overlaps):
+        issues['warnings'].append(
+            f"Overlapping slots: {slots[i].slot_id} and {slots[j].slot_id}"
+        )
+    
+    durations = np.array([(s.end_time - s.start_time).total_seconds() for s in slots]) / 3600
     
     # Check for very short slots
-    short_slots = [s for s in slots if s.duration_hours < 1.0]
-    if short_slots:
+    short_count = int((durations < 1.0).sum())
+    if short_count:
         issues['warnings'].append(
-            f"Found {len(short_slots)} slots shorter than 1 hour"
+            f"Found {short_count} slots shorter than 1 hour"
         )
     
     # Check for very long slots
-    long_slots = [s for s in slots if s.duration_hours > 4.0]
-    if long_slots:
+    long_count = int((durations > 4.0).sum())
+    if long_count:
         issues['warnings'].append(
-            f"Found {len(long_slots)} slots longer than 4 hours"
+            f"Found {long_count} slots longer than 4 hours"
         )
     
     return issues
@@ -191,28 +271,25 @@ def get_slot_summary(slots: List[Slot]) -> Dict:
     if not slots:
         return {}
     
-    df = pd.DataFrame([
-        {
-            'date': slot.date,
-            'weekday': slot.weekday.value,
-            'eml': slot.eml_category.value,
-            'resource': slot.resource,
-            'duration': slot.duration_hours
-        }
-        for slot in slots
-    ])
+    dates = [slot.date for slot in slots]
+    durations = np.array([(slot.end_time - slot.start_time).total_seconds() for slot in slots]) / 3600
     
     summary = {
         'total_slots': len(slots),
         'date_range': {
-            'start': df['date'].min(),
-            'end': df['date'].max()
+            'start': min(dates),
+            'end': max(dates)
         },
-        'weekday_distribution': df['weekday'].value_counts().to_dict(),
-        'eml_distribution': df['eml'].value_counts().to_dict(),
-        'resource_distribution': df['resource'].value_counts().to_dict(),
-        'avg_duration': df['duration'].mean(),
-        'total_hours': df['duration'].sum()
+        'weekday_distribution': _value_counts(slot.weekday.value for slot in slots),
+        'eml_distribution': _value_counts(slot.eml_category.value for slot in slots),
+        'resource_distribution': _value_counts(slot.resource for slot in slots if slot.resource == slot.resource),
+        'avg_duration': durations.mean(),
+        'total_hours': durations.sum()
     }
     
     return summary
+
+
+def _value_counts(values) -> Dict:
+    """Count values, most common first (ties in first-seen order)."""
+    return dict(Counter(values).most_common())
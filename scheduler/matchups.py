@@ -3,8 +3,12 @@ Matchup generation for round-robin scheduling.
 """
 
 import random
+from collections import Counter
+from itertools import product
 from typing import List, Dict, Optional
+import numpy as np
 from .models import Matchup
+from ._kernels import round_robin_indices
 from .config import SchedulerConfig
 
 
@@ -29,43 +33,30 @@ def generate_round_robin(teams: List[str], double_round: bool = True) -> List[Ma
     n_teams = len(teams)
     n_rounds = n_teams - 1
     
-    matchups = []
-    week = 1
+    # (home, away, week, order) rows for a single round robin
+    rows = round_robin_indices(n_teams)
     
-    # Generate single round-robin
-    for round_num in range(n_rounds):
-        for i in range(n_teams // 2):
-            team1_idx = i
-            team2_idx = n_teams - 1 - i
-            
-            # Skip bye games
-            if teams[team1_idx] != "BYE" and teams[team2_idx] != "BYE":
-                matchup = Matchup(
-                    home_team=teams[team1_idx],
-                    away_team=teams[team2_idx],
-                    division="Unknown",  # Will be set later
-                    week_target=week,
-                    order_in_week=i + 1
-                )
-                matchups.append(matchup)
-        
-        # Rotate teams (circle method)
-        teams = [teams[0]] + [teams[-1]] + teams[1:-1]
-        week += 1
+    # Skip bye games
+    names = np.array(teams, dtype=object)
+    rows = rows[(names[rows[:, 0]] != "BYE") & (names[rows[:, 1]] != "BYE")]
     
-    # Generate double round-robin if requested
+    # Generate double round-robin if requested: same pairings with home and
+    # away swapped, n_rounds weeks later
     if double_round:
-        reverse_matchups = []
-        for matchup in matchups:
-            reverse_matchup = Matchup(
-                home_team=matchup.away_team,
-                away_team=matchup.home_team,
-                division=matchup.division,
-                week_target=matchup.week_target + n_rounds,
-                order_in_week=matchup.order_in_week
-            )
-            reverse_matchups.append(reverse_matchup)
-        matchups.extend(reverse_matchups)
+        reverse_rows = rows[:, [1, 0, 2, 3]]
+        reverse_rows[:, 2] += n_rounds
+        rows = np.concatenate([rows, reverse_rows])
+    
+    matchups = [
+        Matchup(
+            home_team=teams[home],
+            away_team=teams[away],
+            division="Unknown",  # Will be set later
+            week_target=week,
+            order_in_week=order
+        )
+        for home, away, week, order in rows.tolist()
+    ]
     
     return matchups
 
@@ -81,13 +72,7 @@ def assign_divisions_to_matchups(matchups: List[Matchup], config: SchedulerConfi
     Returns:
         List[Matchup]: Matchups with division information
     """
-    team_divisions = {}
-    
-    # Build team to division mapping
-    for division in config.divisions:
-        for sub_div in division.sub_divisions:
-            for team in sub_div.teams:
-                team_divisions[team] = division.name
+    team_divisions = config.team_division_map
     
     # Assign divisions to matchups
     for matchup in matchups:
@@ -95,10 +80,7 @@ def assign_divisions_to_matchups(matchups: List[Matchup], config: SchedulerConfi
         away_division = team_divisions.get(matchup.away_team, "Unknown")
         
         # Use home team's division, or create combined division name
-        if home_division == away_division:
-            matchup.division = home_division
-        else:
-            matchup.division = f"{home_division}-{away_division}"
+        matchup.division = home_division if home_division == away_division else f"{home_division}-{away_division}"
     
     return matchups
 
@@ -161,32 +143,25 @@ def generate_cross_division_matchups(config: SchedulerConfig, games_per_pair: in
             teams.extend(sub_div.teams)
         division_teams[division.name] = teams
     
-    # Generate matchups between divisions
+    # Generate matchups between divisions; every matchup gets its own week
     divisions = list(division_teams.keys())
     for i, div1 in enumerate(divisions):
         for div2 in divisions[i+1:]:
-            teams1 = division_teams[div1]
-            teams2 = division_teams[div2]
+            division = f"{div1}-{div2}"
             
-            # Create all possible pairs
-            for team1 in teams1:
-                for team2 in teams2:
-                    for game_num in range(games_per_pair):
-                        # Alternate home/away for multiple games
-                        if game_num % 2 == 0:
-                            home_team, away_team = team1, team2
-                        else:
-                            home_team, away_team = team2, team1
-                        
-                        matchup = Matchup(
-                            home_team=home_team,
-                            away_team=away_team,
-                            division=f"{div1}-{div2}",
-                            week_target=week,
-                            order_in_week=1
-                        )
-                        cross_matchups.append(matchup)
-                        week += 1
+            # All pairs, alternating home/away for multiple games
+            games = product(division_teams[div1], division_teams[div2], range(games_per_pair))
+            cross_matchups.extend(
+                Matchup(
+                    home_team=team2 if game_num % 2 else team1,
+                    away_team=team1 if game_num % 2 else team2,
+                    division=division,
+                    week_target=week_target,
+                    order_in_week=1
+                )
+                for week_target, (team1, team2, game_num) in enumerate(games, start=week)
+            )
+            week = len(cross_matchups) + 1
     
     return cross_matchups
 
@@ -242,21 +217,13 @@ def get_matchup_summary(matchups: List[Matchup]) -> Dict:
     if not matchups:
         return {}
     
-    # Count by division
-    division_counts = {}
-    team_game_counts = {}
-    
-    for matchup in matchups:
-        # Division counts
-        division_counts[matchup.division] = division_counts.get(matchup.division, 0) + 1
-        
-        # Team game counts
-        for team in [matchup.home_team, matchup.away_team]:
-            team_game_counts[team] = team_game_counts.get(team, 0) + 1
+    # Count by division and by team
+    division_counts = Counter(matchup.division for matchup in matchups)
+    team_game_counts = Counter(team for matchup in matchups for team in (matchup.home_team, matchup.away_team))
     
     summary = {
         'total_matchups': len(matchups),
-        'divisions': division_counts,
+        'divisions': dict(division_counts),
         'teams': len(team_game_counts),
         'weeks': max(m.week_target for m in matchups) if matchups else 0,
         'avg_games_per_team': sum(team_game_counts.values()) / len(team_game_counts) if team_game_counts else 0
@@ -4,8 +4,9 @@ Data models for the league scheduler.
 
 from dataclasses import dataclass, field
 from datetime import datetime, date
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable
 from enum import Enum
+import numpy as np
 import pandas as pd
 
 
@@ -25,9 +26,17 @@ class EMLCategory(Enum):
     EARLY = "E"
     MID = "M"
     LATE = "L"
+    
+    @property
+    def index(self) -> int:
+        """Position of this category in array-backed E/M/L counts."""
+        return _EML_INDEX[self]
 
 
-@dataclass
+_EML_INDEX = {category: i for i, category in enumerate(EMLCategory)}
+
+
+@dataclass(slots=True)
 class Slot:
     """A time slot available for scheduling."""
     start_time: datetime
@@ -53,7 +62,7 @@ class Slot:
         return (self.end_time - self.start_time).total_seconds() / 3600
 
 
-@dataclass
+@dataclass(slots=True)
 class Team:
     """A team in the league."""
     name: str
@@ -68,40 +77,65 @@ class Team:
     away_count: int = 0
     games_played: int = 0
     
+    # E/M/L counts as an int array indexed by EMLCategory.index
+    eml_counts_arr: np.ndarray = field(init=False, repr=False, compare=False)
+    
+    # Cached scoring inputs, refreshed whenever the state above changes
+    last_played_day: Optional[int] = None
+    cached_eml_penalty: float = 0.0
+    cached_ha_penalty: float = 0.0
+    
     def __post_init__(self):
         """Initialize default values."""
         if not self.eml_counts:
             self.eml_counts = {EMLCategory.EARLY: 0, EMLCategory.MID: 0, EMLCategory.LATE: 0}
+        self.eml_counts_arr = np.array([self.eml_counts.get(c, 0) for c in EMLCategory], dtype=np.int32)
+        self._refresh_cache()
+    
+    def _refresh_cache(self):
+        """Recompute cached values derived from team state."""
+        self.last_played_day = self.last_played.date().toordinal() if self.last_played else None
+        self.cached_eml_penalty = float(self.get_eml_balance_score())
+        self.cached_ha_penalty = float(abs(self.get_home_away_balance()))
+    
+    def reset_state(self):
+        """Clear all game-derived state."""
+        self.last_played = None
+        self.eml_counts = {k: 0 for k in self.eml_counts}
+        self.eml_counts_arr[:] = 0
+        self.home_count = 0
+        self.away_count = 0
+        self.games_played = 0
+        self._refresh_cache()
     
     def update_after_game(self, game_date: datetime, is_home: bool, eml: EMLCategory):
         """Update team state after playing a game."""
         self.last_played = game_date
         self.eml_counts[eml] += 1
+        self.eml_counts_arr[eml.index] += 1
         if is_home:
             self.home_count += 1
         else:
             self.away_count += 1
         self.games_played += 1
+        self._refresh_cache()
     
     def get_rest_days(self, current_date: datetime) -> int:
         """Get days since last game."""
-        if self.last_played is None:
+        if self.last_played_day is None:
             return 999  # Never played
-        return (current_date.date() - self.last_played.date()).days
+        return current_date.date().toordinal() - self.last_played_day
     
     def get_eml_balance_score(self) -> float:
         """Get E/M/L balance score (lower is better)."""
-        counts = list(self.eml_counts.values())
-        if not counts:
-            return 0.0
-        return max(counts) - min(counts)
+        return int(self.eml_counts_arr.max()) - int(self.eml_counts_arr.min())
     
     def get_home_away_balance(self) -> int:
         """Get home/away balance (positive = more home, negative = more away)."""
         return self.home_count - self.away_count
 
 
-@dataclass
+@dataclass(slots=True)
 class Matchup:
     """A matchup between two teams."""
     home_team: str
@@ -111,6 +145,10 @@ class Matchup:
     order_in_week: int
     matchup_id: Optional[str] = None
     
+    # Resolved Team objects, bound by the engine before scheduling
+    _home: Optional[Team] = field(default=None, init=False, repr=False, compare=False)
+    _away: Optional[Team] = field(default=None, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         if self.matchup_id is None:
             self.matchup_id = f"{self.home_team}_vs_{self.away_team}_W{self.week_target}"
@@ -121,7 +159,7 @@ class Matchup:
         return [self.home_team, self.away_team]
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduledGame:
     """A scheduled game."""
     matchup: Matchup
@@ -144,13 +182,47 @@ class Schedule:
     slots: List[Slot] = field(default_factory=list)
     matchups: List[Matchup] = field(default_factory=list)
     
+    # Games per team name, in schedule order. Rebuilt lazily when games are
+    # appended to the list directly; replacing entries in place requires
+    # an explicit rebuild_index().
+    _by_team: Dict[str, List[ScheduledGame]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _indexed_count: int = field(default=0, init=False, repr=False, compare=False)
+    
     def add_game(self, game: ScheduledGame):
         """Add a game to the schedule."""
         self.games.append(game)
+        if self._indexed_count == len(self.games) - 1:
+            self._index_game(game)
+            self._indexed_count += 1
+    
+    def bulk_add(self, games: Iterable[ScheduledGame]):
+        """
+        Add many games at once and rebuild the per-team index a single time.
+        
+        Args:
+            games: Games to append, in schedule order
+        """
+        self.games.extend(games)
+        self.rebuild_index()
+    
+    def rebuild_index(self):
+        """Recompute the per-team game index from the games list."""
+        self._by_team = {}
+        for game in self.games:
+            self._index_game(game)
+        self._indexed_count = len(self.games)
+    
+    def _index_game(self, game: ScheduledGame):
+        """Add one game to the per-team index."""
+        self._by_team.setdefault(game.matchup.home_team, []).append(game)
+        if game.matchup.away_team != game.matchup.home_team:
+            self._by_team.setdefault(game.matchup.away_team, []).append(game)
     
     def get_team_schedule(self, team_name: str) -> List[ScheduledGame]:
         """Get all games for a specific team."""
-        return [game for game in self.games if team_name in game.matchup.teams]
+        if self._indexed_count != len(self.games):
+            self.rebuild_index()
+        return list(self._by_team.get(team_name, ()))
     
     def get_games_by_date(self, game_date: date) -> List[ScheduledGame]:
         """Get all games on a specific date."""
@@ -161,26 +233,28 @@ class Schedule:
         if not self.games:
             return pd.DataFrame()
         
-        data = []
-        for game in self.games:
-            data.append({
-                'Week': game.matchup.week_target,
-                'Order': game.matchup.order_in_week,
-                'Date': game.scheduled_date.date(),
-                'Day': game.slot.weekday.value,
-                'Start Time': game.slot.start_time.time(),
-                'End Time': game.slot.end_time.time(),
-                'Resource': game.slot.resource,
-                'Home Team': game.matchup.home_team,
-                'Away Team': game.matchup.away_team,
-                'Division': game.matchup.division,
-                'EML': game.slot.eml_category.value,
-                'Days Since Home Played': game.days_since_home_played,
-                'Days Since Away Played': game.days_since_away_played,
-                'Game ID': game.game_id
-            })
+        games = self.games
+        matchups = [game.matchup for game in games]
+        slots = [game.slot for game in games]
         
-        df = pd.DataFrame(data)
+        # Built column by column; Date and the time columns hold date and
+        # time objects, as the exporters and summary stats expect
+        df = pd.DataFrame({
+            'Week': [m.week_target for m in matchups],
+            'Order': [m.order_in_week for m in matchups],
+            'Date': [game.scheduled_date.date() for game in games],
+            'Day': [slot.weekday.value for slot in slots],
+            'Start Time': [slot.start_time.time() for slot in slots],
+            'End Time': [slot.end_time.time() for slot in slots],
+            'Resource': [slot.resource for slot in slots],
+            'Home Team': [m.home_team for m in matchups],
+            'Away Team': [m.away_team for m in matchups],
+            'Division': [m.division for m in matchups],
+            'EML': [slot.eml_category.value for slot in slots],
+            'Days Since Home Played': [game.days_since_home_played for game in games],
+            'Days Since Away Played': [game.days_since_away_played for game in games],
+            'Game ID': [game.game_id for game in games]
+        })
         return df.sort_values(['Date', 'Start Time']).reset_index(drop=True)
     
     def get_summary_stats(self) -> Dict[str, Any]:
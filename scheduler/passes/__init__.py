@@ -6,10 +6,12 @@ from .cap_fix import cap_fix
 from .smooth_gap import smooth_gaps
 from .weekday_balance import balance_weekdays
 from .home_away import balance_home_away
+from .parallel import run_passes
 
 __all__ = [
     "cap_fix",
     "smooth_gaps", 
     "balance_weekdays",
-    "balance_home_away"
+    "balance_home_away",
+    "run_passes"
 ]
@@ -2,11 +2,14 @@
 Cap fix pass to ensure no team exceeds maximum gap between games.
 """
 
+import logging
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 from ..models import Schedule, ScheduledGame, SwapLog
 from ..config import SchedulerConfig
 
+logger = logging.getLogger(__name__)
+
 
 def cap_fix(schedule: Schedule, config: SchedulerConfig) -> Schedule:
     """
@@ -19,16 +22,16 @@ def cap_fix(schedule: Schedule, config: SchedulerConfig) -> Schedule:
     Returns:
         Schedule: Updated schedule with cap violations fixed
     """
-    print("Running cap fix pass...")
+    logger.info("Running cap fix pass...")
     
     # Find teams with gap violations
     violations = _find_gap_violations(schedule, config)
     
     if not violations:
-        print("No gap violations found")
+        logger.info("No gap violations found")
         return schedule
     
-    print(f"Found {len(violations)} gap violations")
+    logger.info("Found %s gap violations", len(violations))
     
     # Try to fix each violation
     fixed_count = 0
@@ -36,7 +39,7 @@ def cap_fix(schedule: Schedule, config: SchedulerConfig) -> Schedule:
         if _fix_team_gap_violation(schedule, team, violation_info, config):
             fixed_count += 1
     
-    print(f"Fixed {fixed_count} gap violations")
+    logger.info("Fixed %s gap violations", fixed_count)
     
     return schedule
 
@@ -265,12 +268,8 @@ def _execute_swap(schedule: Schedule, game1: ScheduledGame, game2: ScheduledGame
 def _update_team_states_after_swap(schedule: Schedule, game1: ScheduledGame, game2: ScheduledGame):
     """Update team states after a swap."""
     # Reset team states
-    for team_name in schedule.teams:
-        schedule.teams[team_name].last_played = None
-        schedule.teams[team_name].eml_counts = {k: 0 for k in schedule.teams[team_name].eml_counts}
-        schedule.teams[team_name].home_count = 0
-        schedule.teams[team_name].away_count = 0
-        schedule.teams[team_name].games_played = 0
+    for team in schedule.teams.values():
+        team.reset_state()
     
     # Rebuild team states in chronological order
     sorted_games = sorted(schedule.games, key=lambda x: x.scheduled_date)
@@ -2,11 +2,14 @@
 Home/away balance pass to ensure teams have balanced home and away games.
 """
 
+import logging
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 from ..models import Schedule, ScheduledGame, SwapLog
 from ..config import SchedulerConfig
 
+logger = logging.getLogger(__name__)
+
 
 def balance_home_away(schedule: Schedule, config: SchedulerConfig) -> Schedule:
     """
@@ -20,23 +23,23 @@ def balance_home_away(schedule: Schedule, config: SchedulerConfig) -> Schedule:
         Schedule: Updated schedule with balanced home/away games
     """
     if config.home_away_band == 0:
-        print("Home/away balancing disabled")
+        logger.info("Home/away balancing disabled")
         return schedule
     
-    print("Running home/away balance pass...")
+    logger.info("Running home/away balance pass...")
     
     # Calculate current home/away distribution
     ha_stats = _calculate_home_away_statistics(schedule)
-    print(f"Current home/away distribution: {ha_stats}")
+    logger.info("Current home/away distribution: %s", ha_stats)
     
     # Find teams with poor home/away balance
     teams_to_improve = _find_teams_with_poor_balance(schedule, config)
     
     if not teams_to_improve:
-        print("No teams need home/away balancing")
+        logger.info("No teams need home/away balancing")
         return schedule
     
-    print(f"Found {len(teams_to_improve)} teams needing home/away balancing")
+    logger.info("Found %s teams needing home/away balancing", len(teams_to_improve))
     
     # Try to improve balance for each team
     improvements_made = 0
@@ -53,9 +56,9 @@ def balance_home_away(schedule: Schedule, config: SchedulerConfig) -> Schedule:
             break
         
         improvements_made += iteration_improvements
-        print(f"Iteration {iteration + 1}: Made {iteration_improvements} improvements")
+        logger.info("Iteration %s: Made %s improvements", iteration + 1, iteration_improvements)
     
-    print(f"Total home/away improvements made: {improvements_made}")
+    logger.info("Total home/away improvements made: %s", improvements_made)
     
     return schedule
 
@@ -301,12 +304,8 @@ def _execute_home_away_swap(schedule: Schedule, game1: ScheduledGame, game2: Sch
 def _update_team_states_after_swap(schedule: Schedule, game1: ScheduledGame, game2: ScheduledGame):
     """Update team states after a swap."""
     # Reset team states
-    for team_name in schedule.teams:
-        schedule.teams[team_name].last_played = None
-        schedule.teams[team_name].eml_counts = {k: 0 for k in schedule.teams[team_name].eml_counts}
-        schedule.teams[team_name].home_count = 0
-        schedule.teams[team_name].away_count = 0
-        schedule.teams[team_name].games_played = 0
+    for team in schedule.teams.values():
+        team.reset_state()
     
     # Rebuild team states in chronological order
     sorted_games = sorted(schedule.games, key=lambda x: x.scheduled_date)
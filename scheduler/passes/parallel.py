@@ -0,0 +1,128 @@
+"""
+Run the optimization passes, in parallel across independent divisions.
+"""
+
+import logging
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Optional
+from ..models import Schedule
+from ..config import SchedulerConfig
+from .cap_fix import cap_fix
+from .smooth_gap import smooth_gaps
+from .weekday_balance import balance_weekdays
+from .home_away import balance_home_away
+
+logger = logging.getLogger(__name__)
+
+
+def run_passes(schedule: Schedule, config: SchedulerConfig,
+               max_workers: Optional[int] = None) -> Schedule:
+    """
+    Run cap fix, gap smoothing, weekday and home/away balancing.
+    
+    When no game crosses divisions, each division is an independent
+    subproblem and is optimized in its own worker process. Otherwise the
+    passes run sequentially on the whole schedule.
+    
+    Args:
+        schedule: Current schedule
+        config: Scheduler configuration
+        max_workers: Maximum worker processes (default: one per division,
+            capped at the CPU count)
+    
+    Returns:
+        Schedule: Optimized schedule
+    """
+    clusters = _split_by_division(schedule, config)
+    
+    if clusters is None or len(clusters) < 2:
+        return _run_all_passes(schedule, config)
+    
+    workers = max_workers or min(len(clusters), os.cpu_count() or 1)
+    logger.info("Running optimization passes over %s divisions with %s workers...", len(clusters), workers)
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker_logging) as executor:
+        results = list(executor.map(_run_all_passes, clusters, [config] * len(clusters)))
+    
+    return _merge_schedules(schedule, results)
+
+
+def _init_worker_logging() -> None:
+    """
+    Give a worker process its own unbuffered log output.
+    
+    Forked workers inherit the parent's buffering handler along with any
+    records still in it; drop it so nothing is written twice.
+    """
+    package_logger = logging.getLogger("scheduler")
+    if not package_logger.handlers:
+        return
+    
+    for handler in list(package_logger.handlers):
+        package_logger.removeHandler(handler)
+    
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(message)s"))
+    package_logger.addHandler(console)
+
+
+def _run_all_passes(schedule: Schedule, config: SchedulerConfig) -> Schedule:
+    """Run the four passes in order on one schedule."""
+    logger.info("1. Running cap fix pass...")
+    schedule = cap_fix(schedule, config)
+    
+    logger.info("2. Running gap smoothing pass...")
+    schedule = smooth_gaps(schedule, config)
+    
+    logger.info("3. Running weekday balance pass...")
+    schedule = balance_weekdays(schedule, config)
+    
+    logger.info("4. Running home/away balance pass...")
+    return balance_home_away(schedule, config)
+
+
+def _split_by_division(schedule: Schedule, config: SchedulerConfig) -> Optional[List[Schedule]]:
+    """
+    Split a schedule into per-division sub-schedules.
+    
+    Returns:
+        List of sub-schedules, or None if any game crosses divisions
+    """
+    team_divisions = config.team_division_map
+    
+    clusters: Dict[str, Schedule] = {}
+    for game in schedule.games:
+        division = team_divisions.get(game.matchup.home_team)
+        if division is None or division != team_divisions.get(game.matchup.away_team):
+            return None
+        
+        cluster = clusters.get(division)
+        if cluster is None:
+            cluster = clusters[division] = Schedule()
+        cluster.games.append(game)
+        cluster.slots.append(game.slot)
+        cluster.matchups.append(game.matchup)
+    
+    for team_name, team in schedule.teams.items():
+        division = team_divisions.get(team_name)
+        if division in clusters:
+            clusters[division].teams[team_name] = team
+    
+    return list(clusters.values())
+
+
+def _merge_schedules(original: Schedule, parts: List[Schedule]) -> Schedule:
+    """Combine optimized per-division sub-schedules into one schedule."""
+    merged = Schedule(
+        slots=original.slots,
+        matchups=original.matchups,
+        teams=dict(original.teams)
+    )
+    
+    for part in parts:
+        merged.games.extend(part.games)
+        merged.teams.update(part.teams)
+    
+    return merged
@@ -2,11 +2,14 @@
 Gap smoothing pass to improve the distribution of gaps between games.
 """
 
+import logging
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 from ..models import Schedule, ScheduledGame, SwapLog
 from ..config import SchedulerConfig
 
+logger = logging.getLogger(__name__)
+
 
 def smooth_gaps(schedule: Schedule, config: SchedulerConfig) -> Schedule:
     """
@@ -19,20 +22,20 @@ def smooth_gaps(schedule: Schedule, config: SchedulerConfig) -> Schedule:
     Returns:
         Schedule: Updated schedule with smoothed gaps
     """
-    print("Running gap smoothing pass...")
+    logger.info("Running gap smoothing pass...")
     
     # Calculate current gap distribution
     gap_stats = _calculate_gap_statistics(schedule)
-    print(f"Current gap stats: avg={gap_stats['avg_gap']:.1f}, std={gap_stats['std_gap']:.1f}")
+    logger.info("Current gap stats: avg=%.1f, std=%.1f", gap_stats['avg_gap'], gap_stats['std_gap'])
     
     # Find teams with poor gap distributions
     teams_to_improve = _find_teams_with_poor_gaps(schedule, config)
     
     if not teams_to_improve:
-        print("No teams need gap smoothing")
+        logger.info("No teams need gap smoothing")
         return schedule
     
-    print(f"Found {len(teams_to_improve)} teams needing gap smoothing")
+    logger.info("Found %s teams needing gap smoothing", len(teams_to_improve))
     
     # Try to improve gaps for each team
     improvements_made = 0
@@ -49,9 +52,9 @@ def smooth_gaps(schedule: Schedule, config: SchedulerConfig) -> Schedule:
             break
         
         improvements_made += iteration_improvements
-        print(f"Iteration {iteration + 1}: Made {iteration_improvements} improvements")
+        logger.info("Iteration %s: Made %s improvements", iteration + 1, iteration_improvements)
     
-    print(f"Total improvements made: {improvements_made}")
+    logger.info("Total improvements made: %s", improvements_made)
     
     return schedule
 
@@ -312,12 +315,8 @@ def _execute_swap(schedule: Schedule, game1: ScheduledGame, game2: ScheduledGame
 def _update_team_states_after_swap(schedule: Schedule, game1: ScheduledGame, game2: ScheduledGame):
     """Update team states after a swap."""
     # Reset team states
-    for team_name in schedule.teams:
-        schedule.teams[team_name].last_played = None
-        schedule.teams[team_name].eml_counts = {k: 0 for k in schedule.teams[team_name].eml_counts}
-        schedule.teams[team_name].home_count = 0
-        schedule.teams[team_name].away_count = 0
-        schedule.teams[team_name].games_played = 0
+    for team in schedule.teams.values():
+        team.reset_state()
     
     # Rebuild team states in chronological order
     sorted_games = sorted(schedule.games, key=lambda x: x.scheduled_date)
@@ -2,11 +2,14 @@
 Weekday balance pass to distribute games evenly across weekdays.
 """
 
+import logging
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 from ..models import Schedule, ScheduledGame, SwapLog, Weekday
 from ..config import SchedulerConfig
 
+logger = logging.getLogger(__name__)
+
 
 def balance_weekdays(schedule: Schedule, config: SchedulerConfig) -> Schedule:
     """
@@ -19,20 +22,20 @@ def balance_weekdays(schedule: Schedule, config: SchedulerConfig) -> Schedule:
     Returns:
         Schedule: Updated schedule with balanced weekdays
     """
-    print("Running weekday balance pass...")
+    logger.info("Running weekday balance pass...")
     
     # Calculate current weekday distribution
     weekday_stats = _calculate_weekday_statistics(schedule)
-    print(f"Current weekday distribution: {weekday_stats}")
+    logger.info("Current weekday distribution: %s", weekday_stats)
     
     # Find teams with poor weekday distribution
     teams_to_improve = _find_teams_with_poor_weekdays(schedule, config)
     
     if not teams_to_improve:
-        print("No teams need weekday balancing")
+        logger.info("No teams need weekday balancing")
         return schedule
     
-    print(f"Found {len(teams_to_improve)} teams needing weekday balancing")
+    logger.info("Found %s teams needing weekday balancing", len(teams_to_improve))
     
     # Try to improve weekday distribution for each team
     improvements_made = 0
@@ -49,9 +52,9 @@ def balance_weekdays(schedule: Schedule, config: SchedulerConfig) -> Schedule:
             break
         
         improvements_made += iteration_improvements
-        print(f"Iteration {iteration + 1}: Made {iteration_improvements} improvements")
+        logger.info("Iteration %s: Made %s improvements", iteration + 1, iteration_improvements)
     
-    print(f"Total weekday improvements made: {improvements_made}")
+    logger.info("Total weekday improvements made: %s", improvements_made)
     
     return schedule
 
@@ -252,12 +255,8 @@ def _execute_weekday_swap(schedule: Schedule, game1: ScheduledGame, game2: Sched
 def _update_team_states_after_swap(schedule: Schedule, game1: ScheduledGame, game2: ScheduledGame):
     """Update team states after a swap."""
     # Reset team states
-    for team_name in schedule.teams:
-        schedule.teams[team_name].last_played = None
-        schedule.teams[team_name].eml_counts = {k: 0 for k in schedule.teams[team_name].eml_counts}
-        schedule.teams[team_name].home_count = 0
-        schedule.teams[team_name].away_count = 0
-        schedule.teams[team_name].games_played = 0
+    for team in schedule.teams.values():
+        team.reset_state()
     
     # Rebuild team states in chronological order
     sorted_games = sorted(schedule.games, key=lambda x: x.scheduled_date)
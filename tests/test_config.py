@@ -65,6 +65,15 @@ def test_config_validation():
             divisions=[],
             weekday_balance_prefer=["InvalidDay"]
         )
+    
+    # Test invalid solver
+    with pytest.raises(ValueError, match="Invalid solver"):
+        SchedulerConfig(
+            timezone="America/Chicago",
+            columns={"type": "Type", "start": "Start", "end": "End", "resource": "Resource"},
+            divisions=[],
+            solver="simplex"
+        )
 
 
 def test_config_load_save():
@@ -0,0 +1,46 @@
+"""
+Tests for E/M/L classification.
+"""
+
+import pytest
+import numpy as np
+from datetime import time
+from pathlib import Path
+import sys
+
+# Add the scheduler package to the path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from scheduler.models import EMLCategory
+from scheduler.eml import eml_category, make_eml_classifier, classify_eml_array, _time_key
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("21:00", EMLCategory.EARLY),
+    ("21:59", EMLCategory.EARLY),
+    ("21:59:30", EMLCategory.MID),
+    ("22:34", EMLCategory.MID),
+    ("22:35", EMLCategory.LATE),
+    ("23:59", EMLCategory.LATE),
+])
+def test_eml_category_cutoffs(value, expected):
+    """Test that the cutoffs are inclusive and classify the default boundaries."""
+    assert eml_category(value) == expected
+    assert eml_category(time.fromisoformat(value)) == expected
+
+
+def test_make_eml_classifier_custom_cutoffs():
+    """Test a classifier built with non-default cutoffs."""
+    classify = make_eml_classifier("20:30", "21:30")
+    
+    assert classify(time(20, 30)) == EMLCategory.EARLY
+    assert classify(time(21, 0)) == EMLCategory.MID
+    assert classify(time(21, 45)) == EMLCategory.LATE
+
+
+def test_classify_eml_array_matches_scalar():
+    """Test that array classification agrees with the scalar classifier."""
+    times = [time(20, 0), time(21, 59), time(21, 59, 30), time(22, 34), time(22, 35), time(23, 59)]
+    keys = np.array([_time_key(t) for t in times], dtype=np.int64)
+    
+    assert list(classify_eml_array(keys)) == [eml_category(t) for t in times]
@@ -0,0 +1,159 @@
+"""
+Tests for the core scheduling engine.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from pathlib import Path
+import sys
+
+# Add the scheduler package to the path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from scheduler.config import SchedulerConfig
+from scheduler.models import Slot, Matchup, ScheduledGame, Schedule, EMLCategory
+from scheduler.eml import get_weekday
+from scheduler.ingest import create_teams_from_config
+from scheduler.matchups import build_matchups
+from scheduler.engine import schedule, validate_schedule
+
+
+def _make_config(n_teams=6):
+    return SchedulerConfig(
+        timezone="America/Chicago",
+        columns={"type": "Type", "start": "Start", "end": "End", "resource": "Resource"},
+        divisions=[
+            {
+                "name": "North",
+                "sub_divisions": [
+                    {"name": "A", "teams": [f"Team {i}" for i in range(1, n_teams + 1)]}
+                ]
+            }
+        ]
+    )
+
+
+def _make_slots(n_days=120):
+    slots = []
+    start = datetime(2025, 1, 6)
+    for day in range(n_days):
+        for hour, resource in [(20, "Rink A"), (21, "Rink A"), (20, "Rink B")]:
+            slot_start = start + timedelta(days=day, hours=hour)
+            slots.append(Slot(
+                start_time=slot_start,
+                end_time=slot_start + timedelta(minutes=90),
+                resource=resource,
+                slot_type="Game Rental",
+                weekday=get_weekday(slot_start),
+                eml_category=EMLCategory.EARLY if hour == 20 else EMLCategory.MID
+            ))
+    return slots
+
+
+def test_each_slot_used_once():
+    """Test that no slot is assigned to more than one game."""
+    config = _make_config()
+    slots = _make_slots()
+    teams = create_teams_from_config(config)
+    matchups = build_matchups(config)
+    
+    result = schedule(slots, matchups, config, teams)
+    
+    slot_ids = [game.slot.slot_id for game in result.games]
+    assert result.games
+    assert len(slot_ids) == len(set(slot_ids))
+
+
+def test_no_team_double_booked():
+    """Test that the engine never schedules a team twice on one date."""
+    config = _make_config()
+    slots = _make_slots()
+    teams = create_teams_from_config(config)
+    matchups = build_matchups(config)
+    
+    result = schedule(slots, matchups, config, teams)
+    violations = validate_schedule(result, config)
+    
+    assert not [e for e in violations['errors'] if 'multiple games' in e]
+
+
+def test_team_schedule_index_matches_games():
+    """Test that per-team lookups agree with a scan of the games list."""
+    config = _make_config()
+    slots = _make_slots()
+    teams = create_teams_from_config(config)
+    matchups = build_matchups(config)
+    
+    result = schedule(slots, matchups, config, teams)
+    extra = ScheduledGame(
+        matchup=Matchup(home_team="Team 1", away_team="Team 2", division="North",
+                        week_target=99, order_in_week=1),
+        slot=slots[-1],
+        scheduled_date=slots[-1].start_time,
+        days_since_home_played=0,
+        days_since_away_played=0
+    )
+    result.games.append(extra)
+    
+    for team_name in teams:
+        expected = [game for game in result.games if team_name in game.matchup.teams]
+        assert result.get_team_schedule(team_name) == expected
+
+
+def test_validate_reports_insufficient_rest():
+    """Test that the validator flags games closer than rest_min_days."""
+    config = _make_config(n_teams=4)
+    slots = _make_slots(n_days=3)
+    teams = create_teams_from_config(config)
+    
+    result = Schedule(teams=teams, slots=slots)
+    for slot, (home, away) in zip([slots[0], slots[3]], [("Team 1", "Team 2"), ("Team 3", "Team 1")]):
+        matchup = Matchup(home_team=home, away_team=away, division="North",
+                          week_target=1, order_in_week=1)
+        result.matchups.append(matchup)
+        result.add_game(ScheduledGame(
+            matchup=matchup,
+            slot=slot,
+            scheduled_date=slot.start_time,
+            days_since_home_played=0,
+            days_since_away_played=0
+        ))
+    
+    violations = validate_schedule(result, config)
+    
+    assert violations['errors'] == ["Away team Team 1 has insufficient rest: 1 days"]
+
+
+def _make_tight_slots():
+    slots = []
+    for day in range(0, 30, 3):
+        for i, resource in enumerate(["Rink A", "Rink B", "Rink C"]):
+            slot_start = datetime(2025, 1, 6, 20 + i) + timedelta(days=day)
+            slots.append(Slot(
+                start_time=slot_start,
+                end_time=slot_start + timedelta(minutes=90),
+                resource=resource,
+                slot_type="Game Rental",
+                weekday=get_weekday(slot_start),
+                eml_category=EMLCategory.EARLY
+            ))
+    return slots
+
+
+@pytest.mark.parametrize("solver", ["backtrack", "cpsat"])
+def test_solver_schedules_tight_instance(solver):
+    """Test that the search-based solvers place every matchup when slots are scarce."""
+    if solver == "cpsat":
+        pytest.importorskip("ortools")
+    
+    config = _make_config()
+    config.solver = solver
+    slots = _make_tight_slots()
+    teams = create_teams_from_config(config)
+    matchups = build_matchups(config)
+    
+    result = schedule(slots, matchups, config, teams)
+    violations = validate_schedule(result, config)
+    
+    assert len(result.games) == len(matchups)
+    assert violations['errors'] == []
@@ -0,0 +1,39 @@
+"""
+Tests for Excel export.
+"""
+
+import pytest
+import pandas as pd
+from pathlib import Path
+import sys
+
+# Add the scheduler package to the path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from scheduler.ingest import create_teams_from_config
+from scheduler.matchups import build_matchups
+from scheduler.engine import schedule
+from scheduler.export import write_excel
+from tests.test_engine import _make_config, _make_slots
+
+
+@pytest.mark.parametrize("engine", ["xlsxwriter", "openpyxl_writeonly"])
+def test_summary_sheets_match_schedule(tmp_path, engine):
+    """Test that the summary sheets agree with the exported schedule."""
+    config = _make_config()
+    config.excel.engine = engine
+    slots = _make_slots()
+    teams = create_teams_from_config(config)
+    matchups = build_matchups(config)
+    result = schedule(slots, matchups, config, teams)
+    
+    output_path = tmp_path / "schedule.xlsx"
+    write_excel(result, config, str(output_path))
+    
+    final = pd.read_excel(output_path, sheet_name="Final Schedule")
+    weekdays = pd.read_excel(output_path, sheet_name="Weekday Spread", nrows=len(teams))
+    gap_stats = pd.read_excel(output_path, sheet_name="Gap Analysis", nrows=1)
+    
+    assert len(final) == len(result.games)
+    assert weekdays.iloc[:, 2:].to_numpy().sum() == 2 * len(result.games)
+    assert gap_stats.at[0, 'Total Gaps'] == 2 * len(result.games) - len(teams)
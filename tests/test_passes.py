@@ -0,0 +1,60 @@
+"""
+Tests for the schedule optimization passes.
+"""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+import sys
+
+# Add the scheduler package to the path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from scheduler.config import SchedulerConfig
+from scheduler.models import Slot, EMLCategory
+from scheduler.eml import get_weekday
+from scheduler.ingest import create_teams_from_config
+from scheduler.matchups import build_matchups
+from scheduler.engine import schedule, validate_schedule
+from scheduler.passes import run_passes
+
+
+def _make_config():
+    return SchedulerConfig(
+        timezone="America/Chicago",
+        columns={"type": "Type", "start": "Start", "end": "End", "resource": "Resource"},
+        divisions=[
+            {"name": "North", "sub_divisions": [{"name": "A", "teams": ["N1", "N2", "N3", "N4"]}]},
+            {"name": "South", "sub_divisions": [{"name": "B", "teams": ["S1", "S2", "S3", "S4"]}]}
+        ]
+    )
+
+
+def _make_slots(n_days=90):
+    slots = []
+    start = datetime(2025, 1, 6)
+    for day in range(n_days):
+        for hour, resource in [(20, "Rink A"), (21, "Rink A"), (22, "Rink B")]:
+            slot_start = start + timedelta(days=day, hours=hour)
+            slots.append(Slot(
+                start_time=slot_start,
+                end_time=slot_start + timedelta(minutes=90),
+                resource=resource,
+                slot_type="Game Rental",
+                weekday=get_weekday(slot_start),
+                eml_category=EMLCategory.EARLY if hour < 22 else EMLCategory.LATE
+            ))
+    return slots
+
+
+def test_run_passes_keeps_all_games():
+    """Test that running the passes per division keeps every game and team."""
+    config = _make_config()
+    teams = create_teams_from_config(config)
+    initial = schedule(_make_slots(), build_matchups(config), config, teams)
+    game_ids = {game.game_id for game in initial.games}
+    
+    result = run_passes(initial, config, max_workers=2)
+    
+    assert {game.game_id for game in result.games} == game_ids
+    assert set(result.teams) == set(teams)
+    assert not [e for e in validate_schedule(result, config)['errors'] if 'multiple games' in e]